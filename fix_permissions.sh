@@ -20,7 +20,10 @@ find "$BASE_DIR" -type f -name "*.py" -exec chmod 644 {} \;
 
 echo "[INFO] Setting script permissions..."
 for script in \
+    "$BASE_DIR/scripts/adamctl.py" \
     "$BASE_DIR/scripts/music_takeaway.py" \
+    "$BASE_DIR/scripts/benchmark_display.py" \
+    "$BASE_DIR/scripts/benchmark_imports.py" \
     "$BASE_DIR/scripts/roulette.sh" \
     "$BASE_DIR/scripts/roulette_album.sh" \
     "$BASE_DIR/scripts/shutdown.sh"
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+import json
+import os
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.service.control_protocol import ControlError, request, socket_path
+
+EXIT_FAILED = 1
+EXIT_UNREACHABLE = 2
+
+def parse_args(argv):
+    args = {}
+    for item in argv:
+        key, _, value = item.partition('=')
+        try:
+            args[key] = json.loads(value) if value else True
+        except ValueError:
+            args[key] = value
+    return args
+
+def main(argv):
+    if not argv:
+        print("usage: adamctl.py COMMAND [key=value ...]", file=sys.stderr)
+        return EXIT_FAILED
+    try:
+        response = request(socket_path(), argv[0], parse_args(argv[1:]))
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("[ERROR] Player service not running", file=sys.stderr)
+        return EXIT_UNREACHABLE
+    except (ControlError, OSError, ValueError) as e:
+        print(f"[ERROR] Control request failed: {e}", file=sys.stderr)
+        return EXIT_FAILED
+
+    if not response.pop('ok', False):
+        print(f"[ERROR] {response.get('error', 'Command failed')}", file=sys.stderr)
+        return EXIT_FAILED
+    details = ' '.join(f"{key}={value}" for key, value in response.items())
+    print(f"[OK] {argv[0]} {details}".rstrip())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
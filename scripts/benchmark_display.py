@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.core.config import Config
+from src.hardware.display.backends import BACKENDS, LgpioBackend
+from src.hardware.display.tm1637 import TM1637
+from src.utils.logger import Logger
+
+log = Logger()
+
+def build_workload():
+    frames = TM1637.TIME_COLON_FRAMES[:600]
+    full = [TM1637.frame_transactions(frame) for frame in frames]
+    delta = [
+        TM1637.frame_transactions(frame, previous)
+        for previous, frame in zip(frames, frames[1:])
+    ]
+    return {'full': full, 'delta': delta}
+
+def run_benchmark(backend_name, options, workload, iterations):
+    config = Config()
+    pins = config.get('gpio.display')
+    backend = BACKENDS[backend_name](pins['clk'], pins['dio'], options)
+    try:
+        results = {}
+        for label, transactions in workload.items():
+            start = time.perf_counter()
+            for i in range(iterations):
+                backend.send(transactions[i % len(transactions)])
+            results[label] = (time.perf_counter() - start) / iterations * 1e6
+        return results
+    finally:
+        backend.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure TM1637 frame write cost per backend")
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--backend', choices=sorted(BACKENDS), action='append')
+    args = parser.parse_args()
+
+    log.warning("Stop the adam service first: the benchmark drives the display pins directly")
+    workload = build_workload()
+    base_options = Config().get('display.lgpio', {})
+
+    runs = []
+    for name in args.backend or sorted(BACKENDS):
+        if name == LgpioBackend.name:
+            for mode in LgpioBackend.MODES:
+                runs.append((f"{name}/{mode}", name, dict(base_options, mode=mode)))
+        else:
+            runs.append((name, name, base_options))
+
+    for label, name, options in runs:
+        try:
+            results = run_benchmark(name, options, workload, args.iterations)
+        except Exception as e:
+            log.error(f"{label}: unavailable ({e})")
+            continue
+        log.info(f"{label}: {results['full']:.0f} us/full frame, "
+                 f"{results['delta']:.0f} us/delta frame")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.utils.logger import Logger
+
+log = Logger()
+
+HARDWARE_MODULES = ('gpiozero', 'lgpio', 'mpd', 'psutil')
+COPY_MODULES = ('src.utils.storage', 'src.service.usb_copy_service', 'hashlib')
+CLIENT_MODULES = HARDWARE_MODULES + COPY_MODULES + ('src.core', 'src.service.control', 'src.service.player_service')
+
+TARGETS = {
+    'service': {
+        'statement': "import src.service.player_service",
+        'budget_ms': 200,
+        'forbidden': HARDWARE_MODULES + COPY_MODULES + ('concurrent.futures', 'subprocess', 'typing')
+    },
+    'adamctl': {
+        'statement': "import sys; sys.path.insert(0, 'scripts'); import adamctl",
+        'budget_ms': 50,
+        'forbidden': CLIENT_MODULES
+    },
+    'toggle': {
+        'statement': "import sys; sys.path.insert(0, 'scripts/toggle_scripts'); import toggle_brightness",
+        'budget_ms': 50,
+        'forbidden': CLIENT_MODULES
+    },
+    'music_takeaway': {
+        'statement': "import sys; sys.path.insert(0, 'scripts'); import music_takeaway",
+        'budget_ms': 150,
+        'forbidden': HARDWARE_MODULES + COPY_MODULES + ('src.service.player_service',)
+    }
+}
+
+def parse_importtime(output):
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return imports
+
+def trace(statement):
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise RuntimeError(error[-1] if error else f"exit status {result.returncode}")
+    return parse_importtime(result.stderr)
+
+def startup_modules():
+    return {name for name, _, _, _ in trace('pass')}
+
+def measure(statement, baseline, runs):
+    trace(statement)
+    samples = []
+    for _ in range(runs):
+        imports = trace(statement)
+        samples.append(sum(cumulative for name, depth, _, cumulative in imports
+                           if depth == 0 and name not in baseline))
+    return statistics.median(samples) / 1000, imports
+
+def heaviest(imports, baseline, count):
+    own = [(self_us, name) for name, _, self_us, _ in imports if name not in baseline]
+    return sorted(own, reverse=True)[:count]
+
+def forbidden_loaded(imports, forbidden):
+    loaded = {name for name, _, _, _ in imports}
+    return sorted(name for name in loaded
+                  if any(name == module or name.startswith(module + '.') for module in forbidden))
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time of the service and helper scripts")
+    parser.add_argument('targets', nargs='*', metavar='TARGET',
+                        help=f"targets to check: {', '.join(TARGETS)} (default: all)")
+    parser.add_argument('--runs', type=int, default=5, help="measured runs per target")
+    parser.add_argument('--top', type=int, default=0, help="show the N slowest imports per target")
+    args = parser.parse_args()
+    unknown = [name for name in args.targets if name not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target: {', '.join(unknown)}")
+
+    baseline = startup_modules()
+    failed = False
+    for name in args.targets or TARGETS:
+        target = TARGETS[name]
+        try:
+            elapsed, imports = measure(target['statement'], baseline, args.runs)
+        except RuntimeError as e:
+            log.error(f"{name}: import failed ({e})")
+            failed = True
+            continue
+
+        loaded = forbidden_loaded(imports, target['forbidden'])
+        summary = f"{name}: {elapsed:.1f} ms (budget {target['budget_ms']} ms)"
+        if elapsed > target['budget_ms'] or loaded:
+            log.error(summary)
+            failed = True
+        else:
+            log.ok(summary)
+        if loaded:
+            log.error(f"{name}: eagerly imports {', '.join(loaded)}")
+        for self_us, module in heaviest(imports, baseline, args.top):
+            log.info(f"{name}: {self_us / 1000:6.1f} ms  {module}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
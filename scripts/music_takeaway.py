@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
+import argparse
 import os
 import sys
-import socket
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.service.usb_copy_service import USBCopyService
+from src.service.control import ControlError, send_command
+from src.service.control_protocol import socket_path
 from src.utils.logger import Logger
 
 log = Logger()
@@ -26,13 +27,54 @@ BANNER = """
 Version 0.1.0 (2025) - Streamdigger
 """
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Copy albums to a USB drive")
+    parser.add_argument('--queue', action='store_true',
+                        help="copy every album in the current MPD queue")
+    parser.add_argument('--mirror', action='store_true',
+                        help="write the same albums to every connected USB drive")
+    parser.add_argument('albums', nargs='*',
+                        help="album folders or tracks, relative to the music root")
+    return parser.parse_args()
+
+def submit_copy(args):
+    try:
+        response = send_command(socket_path(), 'copy', files=args.albums, queue=args.queue,
+                                mirror=args.mirror)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    if response['position']:
+        log.ok(f"Copy queued (job {response['job']}, {response['position']} ahead)")
+    else:
+        log.ok(f"Copy started (job {response['job']})")
+    return True
+
 def main():
+    args = parse_args()
     print(BANNER)
     try:
-        log.info("Starting USB copy operation")
+        if submit_copy(args):
+            return
+    except ControlError as e:
+        log.error(f"Copy request rejected: {e}")
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        log.error(f"Player service not reachable: {e}")
+        sys.exit(1)
+
+    try:
+        log.info("Player service not running, copying in foreground")
+        from src.service.usb_copy_service import USBCopyService
         copy_service = USBCopyService()
-        log.wait("Copying current track")
-        copy_service.copy_current_track()
+        if args.queue:
+            log.wait("Copying current queue")
+            copy_service.copy_queue(args.mirror)
+        elif args.albums:
+            log.wait(f"Copying {len(args.albums)} albums")
+            copy_service.copy_albums(args.albums, args.mirror)
+        else:
+            log.wait("Copying current track")
+            copy_service.copy_current_track(args.mirror)
         log.ok("Copy operation completed")
         
     except Exception as e:
@@ -1,25 +1,20 @@
 #!/bin/bash
 
 PROJECT_ROOT="$(dirname "$(dirname "$(readlink -f "$0")")")"
-export PYTHONPATH="$PROJECT_ROOT:$PYTHONPATH"
 
-python3 -c "
-from src.utils.logger import Logger
-log = Logger()
-log.info('Starting random mode...')
-"
+python3 "$PROJECT_ROOT/scripts/adamctl.py" roulette mode=tracks
+status=$?
+[ $status -eq 2 ] || exit $status
 
-mpc repeat off
-mpc single off
-mpc random off
-mpc consume on
+echo "[INFO] Starting random mode..."
+
+mpc -q repeat off
+mpc -q single off
+mpc -q random off
+mpc -q consume on
 
 sudo pkill -f ashuffle
-mpc clear
+mpc -q clear
 ashuffle &
 
-python3 -c "
-from src.utils.logger import Logger
-log = Logger()
-log.ok('Random mode activated')
-"
+echo "[OK] Random mode activated"
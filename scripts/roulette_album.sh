@@ -1,22 +1,17 @@
 #!/bin/bash
 
 PROJECT_ROOT="$(dirname "$(dirname "$(readlink -f "$0")")")"
-export PYTHONPATH="$PROJECT_ROOT:$PYTHONPATH"
 
-python3 -c "
-from src.utils.logger import Logger
-log = Logger()
-log.info('Starting album random mode...')
-"
+python3 "$PROJECT_ROOT/scripts/adamctl.py" roulette mode=album
+status=$?
+[ $status -eq 2 ] || exit $status
 
-mpc consume off
+echo "[INFO] Starting album random mode..."
+
+mpc -q consume off
 
 sudo pkill -f ashuffle
-mpc clear
+mpc -q clear
 ashuffle --group-by album &
 
-python3 -c "
-from src.utils.logger import Logger
-log = Logger()
-log.ok('Album random mode activated')
-"
+echo "[OK] Album random mode activated"
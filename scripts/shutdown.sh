@@ -1,21 +1,15 @@
 #!/bin/bash
-python3 -c "
-from src.utils.logger import Logger
-log = Logger()
-log.info('Starting shutdown process...')
-"
 
-python3 -c "
-from src.utils.logger import Logger
-log = Logger()
-log.wait('Stopping playback...')
-"
-mpc stop
+PROJECT_ROOT="$(dirname "$(dirname "$(readlink -f "$0")")")"
+
+python3 "$PROJECT_ROOT/scripts/adamctl.py" shutdown
+status=$?
+[ $status -eq 2 ] || exit $status
+
+echo "[INFO] Starting shutdown process..."
+echo "[WAIT] Stopping playback..."
+mpc -q stop
 sleep 0.2
 
-python3 -c "
-from src.utils.logger import Logger
-log = Logger()
-log.wait('Shutting down system...')
-"
+echo "[WAIT] Shutting down system..."
 sudo systemctl poweroff
@@ -5,7 +5,7 @@ setup(
     version="2.0.0",
     packages=find_packages(),
     package_dir={"": "."},
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     install_requires=[
         "python-mpd2>=3.1.1",
         "gpiozero>=2.0.1",
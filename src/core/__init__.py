@@ -1,8 +1,15 @@
-from .config import Config
-from .mpd_client import MPDClient
+from src.utils.lazy import lazy_exports
 from src.utils.logger import Logger
 
 log = Logger()
 log.debug("Initializing core components")
 
-__all__ = ["Config", "MPDClient"]
+_EXPORTS = {
+    "Config": ".config",
+    "MPDClient": ".mpd_client",
+    "MPDIdleWatcher": ".mpd_client",
+    "MPDSnapshot": ".mpd_client"
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(globals(), _EXPORTS)
@@ -1,9 +1,58 @@
 import json
 import os
+from types import MappingProxyType
 from src.utils.logger import Logger
 
 log = Logger()
 
+_MISSING = object()
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _flatten(settings, prefix='', flat=None):
+    if flat is None:
+        flat = {}
+    for key, value in settings.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, MappingProxyType):
+            _flatten(value, f"{path}.", flat)
+    return flat
+
+class Setting:
+    __slots__ = ('_config', 'key', 'default', 'type', '_generation', '_value')
+
+    def __init__(self, config, key, default=None, type=None):
+        self._config = config
+        self.key = key
+        self.default = default
+        self.type = type
+        self._generation = -1
+        self._value = default
+
+    def __call__(self):
+        config = self._config
+        if self._generation != config.generation:
+            self._value = self._resolve(config.get(self.key, _MISSING))
+            self._generation = config.generation
+        return self._value
+
+    def _resolve(self, value):
+        if value is _MISSING:
+            return self.default
+        if self.type is None or value is None or isinstance(value, self.type):
+            return value
+        try:
+            return self.type(value)
+        except (TypeError, ValueError):
+            log.warning(f"Invalid value for {self.key}: {value!r}, using {self.default!r}")
+            return self.default
+
 class Config:
     _instance = None
 
@@ -18,39 +67,70 @@ class Config:
             log.debug("Initializing configuration manager")
             base_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
             self.config_path = os.path.join(base_path, 'config', 'settings.json')
-            self.config = {}
+            self.generation = 0
+            self._set_snapshot({})
             self.load_config()
             log.configure(self.config)
             log.ok("Configuration manager initialized")
             self.initialized = True
 
+    def _set_snapshot(self, config):
+        config = _freeze(config)
+        self._flat = _flatten(config)
+        self.config = config
+        self.generation += 1
+
     def load_config(self):
         try:
             log.debug(f"Loading configuration from {self.config_path}")
             if not os.path.exists(self.config_path):
                 log.warning("Configuration file not found, using defaults")
-                self.config = {}
+                self._set_snapshot({})
                 return
 
             with open(self.config_path, 'r') as f:
                 content = f.read().strip()
                 if not content:
                     log.warning("Empty configuration file, using defaults")
-                    self.config = {}
+                    self._set_snapshot({})
                     return
-                
-                self.config = json.loads(content)
+
+                self._set_snapshot(json.loads(content))
                 log.ok("Configuration loaded successfully")
-            
-        except Exception as e:
+
+        except (OSError, ValueError) as e:
             log.error(f"Failed to load configuration: {e}")
-            self.config = {}
+            self._set_snapshot({})
 
-    def get(self, key, default=None):
+    def apply(self, config):
+        self._set_snapshot(config)
+        log.configure(self.config)
+        log.debug(f"Configuration snapshot applied (generation {self.generation})")
+
+    def update(self, key, value):
         try:
-            value = self.config
-            for k in key.split('.'):
-                value = value[k]
-            return value
-        except:
-            return default
+            with open(self.config_path, 'r') as f:
+                content = f.read().strip()
+            settings = json.loads(content) if content else {}
+        except FileNotFoundError:
+            settings = {}
+
+        node = settings
+        parts = key.split('.')
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+
+        temp_path = self.config_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(settings, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.config_path)
+        self.apply(settings)
+
+    def get(self, key, default=None):
+        return self._flat.get(key, default)
+
+    def setting(self, key, default=None, type=None):
+        return Setting(self, key, default, type)
@@ -0,0 +1,130 @@
+import ctypes
+import json
+import os
+import select
+import struct
+import threading
+from src.utils.logger import Logger
+
+log = Logger()
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct('iIII')
+
+def _open_inotify(directory):
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    if libc.inotify_add_watch(fd, os.fsencode(directory), IN_WATCH_MASK) < 0:
+        errno = ctypes.get_errno()
+        os.close(fd)
+        raise OSError(errno, f"inotify_add_watch failed for {directory}")
+    return fd
+
+class ConfigWatcher:
+    def __init__(self, path, wakeup=None, debounce_time=0.1, poll_interval=1.0):
+        self.path = path
+        self.directory = os.path.dirname(path)
+        self.filename = os.path.basename(path)
+        self.debounce_time = debounce_time
+        self.poll_interval = poll_interval
+        self._wakeup = wakeup or threading.Event()
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._thread = None
+        self._fd = None
+
+    def start(self):
+        try:
+            self._fd = _open_inotify(self.directory)
+            target = self._run_inotify
+            log.debug(f"Watching {self.path} with inotify")
+        except (OSError, AttributeError) as e:
+            target = self._run_polling
+            log.warning(f"inotify unavailable ({e}), polling {self.path}")
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=target, name="config-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=max(self.poll_interval, self.debounce_time) * 2)
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def take_snapshot(self):
+        with self._lock:
+            snapshot = self._snapshot
+            self._snapshot = None
+        return snapshot
+
+    def _publish(self):
+        try:
+            with open(self.path, 'r') as f:
+                content = f.read().strip()
+            snapshot = json.loads(content) if content else {}
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable configuration update: {e}")
+            return
+
+        with self._lock:
+            self._snapshot = snapshot
+        log.debug("Configuration change detected")
+        self._wakeup.set()
+
+    def _read_events(self):
+        matched = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return matched
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if os.fsdecode(name) == self.filename:
+                    matched = True
+
+    def _run_inotify(self):
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        pending = False
+        while not self._stop_event.is_set():
+            timeout = self.debounce_time if pending else self.poll_interval
+            if poller.poll(timeout * 1000):
+                pending = self._read_events() or pending
+            elif pending:
+                pending = False
+                self._publish()
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return None
+
+    def _run_polling(self):
+        signature = self._file_signature()
+        while not self._stop_event.wait(self.poll_interval):
+            current = self._file_signature()
+            if current == signature:
+                continue
+            if self._stop_event.wait(self.debounce_time):
+                break
+            signature = self._file_signature()
+            self._publish()
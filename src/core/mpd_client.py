@@ -1,17 +1,88 @@
-from mpd import MPDClient as BaseMPDClient
+import socket
+import threading
 import time
+from collections import namedtuple
 from src.utils.logger import Logger
 
 log = Logger()
 
+MPDSnapshot = namedtuple('MPDSnapshot', ['status', 'song'])
+
+def _base_client(timeout):
+    from mpd import MPDClient as BaseMPDClient
+    client = BaseMPDClient()
+    client.timeout = timeout
+    return client
+
+def _song_duration(song):
+    try:
+        return float(song.get('duration', song.get('time', 0)))
+    except (ValueError, TypeError):
+        return 0.0
+
+class QueueSummary:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.version = None
+        self.ids = []
+        self.durations = []
+        self.total_time = 0.0
+
+    @property
+    def total_tracks(self):
+        return len(self.ids)
+
+    def restore(self, version, ids, durations):
+        if len(ids) != len(durations):
+            raise ValueError("Queue ids and durations differ in length")
+        self.ids = list(ids)
+        self.durations = [float(duration) for duration in durations]
+        self.total_time = sum(self.durations)
+        self.version = version
+
+    def matches(self, status):
+        if self.version is None or status.get('playlist') != self.version:
+            return False
+        if self.total_tracks != int(status.get('playlistlength', 0)):
+            return False
+        pos = status.get('song')
+        return pos is None or self.ids[int(pos)] == status.get('songid')
+
+    def load(self, version, playlist):
+        self.ids = [song.get('id') for song in playlist]
+        self.durations = [_song_duration(song) for song in playlist]
+        self.total_time = sum(self.durations)
+        self.version = version
+
+    def resize(self, length):
+        if length < len(self.ids):
+            self.total_time -= sum(self.durations[length:])
+            del self.ids[length:]
+            del self.durations[length:]
+        else:
+            missing = length - len(self.ids)
+            self.ids.extend([None] * missing)
+            self.durations.extend([0.0] * missing)
+
+    def set(self, pos, song_id, duration):
+        self.total_time += duration - self.durations[pos]
+        self.ids[pos] = song_id
+        self.durations[pos] = duration
+
 class MPDClient:
-    def __init__(self, host='localhost', port=6600):
+    def __init__(self, host='localhost', port=6600, timeout=None):
         self.host = host
         self.port = port
-        self._client = BaseMPDClient()
+        self._client = _base_client(timeout)
         self._connected = False
         self._last_try = 0
         self._retry_interval = 5
+        self._queue = QueueSummary()
+        self._restored_queue = None
+        self._song_id = None
+        self._song = None
         log.debug(f"MPD client initialized for {host}:{port}")
 
     def connect(self):
@@ -21,60 +92,327 @@ class MPDClient:
                 log.wait("Attempting to connect to MPD...")
                 self._client.connect(self.host, self.port)
                 self._connected = True
+                self._queue.reset()
+                self._song_id = None
+                self._song = None
                 log.ok(f"Connected to MPD at {self.host}:{self.port}")
                 return True
             except:
-                self._connected = False
+                self._reset_connection()
                 self._last_try = current_time
                 log.error(f"Failed to connect to MPD at {self.host}:{self.port}")
         return self._connected
 
+    def wait_connected(self, timeout, interval=0.25):
+        deadline = time.monotonic() + timeout
+        while True:
+            self._last_try = 0
+            if self.connect():
+                return True
+            if time.monotonic() + interval >= deadline:
+                return False
+            time.sleep(interval)
+
     def get_status(self):
         try:
             if self.connect():
                 status = self._client.status()
-                log.debug(f"MPD status: {status}")
+                log.debug("MPD status: %s", status)
                 return status
         except:
-            self._connected = False
+            self._reset_connection()
             log.error("Failed to get MPD status")
         return None
 
+    def command_list(self, *commands):
+        self._client.command_list_ok_begin()
+        try:
+            for command in commands:
+                if isinstance(command, str):
+                    command = (command,)
+                getattr(self._client, command[0])(*command[1:])
+        except Exception:
+            self._client.command_list_end()
+            raise
+        return self._client.command_list_end()
+
+    def execute(self, *commands):
+        if not self.connect():
+            raise ConnectionError(f"MPD not reachable at {self.host}:{self.port}")
+        try:
+            return self.command_list(*commands)
+        except Exception:
+            self._reset_connection()
+            raise
+
+    def toggle_option(self, option):
+        if not self.connect():
+            raise ConnectionError(f"MPD not reachable at {self.host}:{self.port}")
+        try:
+            enabled = self._client.status().get(option, '0') != '0'
+            getattr(self._client, option)(0 if enabled else 1)
+        except Exception:
+            self._reset_connection()
+            raise
+        return not enabled
+
+    def get_snapshot(self):
+        try:
+            if self.connect():
+                status = self._client.status()
+                if status.get('songid') != self._song_id:
+                    status, song = self.command_list('status', 'currentsong')
+                    self._song_id = status.get('songid')
+                    self._song = song or None
+                    log.debug("Current song: %s", self._song)
+                log.debug("MPD status: %s", status)
+                return MPDSnapshot(status, self._song if self._song_id else None)
+        except Exception:
+            self._reset_connection()
+            self._song_id = None
+            self._song = None
+            log.error("Failed to get MPD snapshot")
+        return MPDSnapshot(None, None)
+
     def get_current_song(self):
         try:
             if self.connect():
                 song = self._client.currentsong()
-                log.debug(f"Current song: {song}")
+                log.debug("Current song: %s", song)
                 return song
         except:
-            self._connected = False
+            self._reset_connection()
             log.error("Failed to get current song")
         return None
 
+    def _reset_connection(self):
+        self._connected = False
+        try:
+            self._client.disconnect()
+        except Exception:
+            pass
+
     def close(self):
         if self._connected:
             try:
                 log.debug("Closing MPD connection")
                 self._client.close()
-                self._client.disconnect()
                 log.ok("MPD connection closed")
             except:
                 log.error("Error closing MPD connection")
             finally:
-                self._connected = False
+                self._reset_connection()
 
     def get_playlist_info(self):
         try:
             if self.connect():
                 status = self._client.status()
                 playlist = self._client.playlistinfo()
-                log.debug(f"Playlist info retrieved: {len(playlist)} tracks")
+                log.debug("Playlist info retrieved: %d tracks", len(playlist))
                 return {
                     'total_tracks': int(status.get('playlistlength', 0)),
                     'tracks': playlist
                 }
         except:
-            self._connected = False
+            self._reset_connection()
             log.error("Failed to get playlist info")
         return {'total_tracks': 0, 'tracks': []}
 
+    def get_queue_summary(self, status=None):
+        try:
+            if self.connect():
+                if status is None:
+                    status = self._client.status()
+                version = status.get('playlist')
+                length = int(status.get('playlistlength', 0))
+                if self._restored_queue is not None:
+                    self._adopt_restored_queue(status)
+                if version != self._queue.version:
+                    self._update_queue_summary(version, length)
+                return {
+                    'total_tracks': self._queue.total_tracks,
+                    'total_time': self._queue.total_time
+                }
+        except Exception:
+            self._reset_connection()
+            self._queue.reset()
+            log.error("Failed to get queue summary")
+        return {'total_tracks': 0, 'total_time': 0.0}
+
+    def queue_snapshot(self):
+        queue = self._queue if self._queue.version is not None else self._restored_queue
+        if queue is None or queue.version is None:
+            return None
+        return {'version': queue.version, 'ids': queue.ids, 'durations': queue.durations}
+
+    def restore_queue(self, snapshot):
+        queue = QueueSummary()
+        try:
+            queue.restore(snapshot['version'], snapshot['ids'], snapshot['durations'])
+        except (KeyError, TypeError, ValueError) as e:
+            log.warning(f"Ignoring saved queue summary: {e}")
+            return
+        self._restored_queue = queue
+
+    def _adopt_restored_queue(self, status):
+        queue, self._restored_queue = self._restored_queue, None
+        try:
+            valid = queue.matches(status)
+        except (IndexError, ValueError):
+            valid = False
+        if valid:
+            self._queue = queue
+            log.debug("Restored queue summary: %d tracks", queue.total_tracks)
+        else:
+            log.debug("Saved queue summary is out of date")
+
+    def _update_queue_summary(self, version, length):
+        queue = self._queue
+        if queue.version is None:
+            playlist = self._client.playlistinfo()
+            queue.load(version, playlist)
+            log.debug("Queue summary loaded: %d tracks", queue.total_tracks)
+            return
+
+        known = dict(zip(queue.ids, queue.durations))
+        changes = self._client.plchangesposid(queue.version)
+        queue.resize(length)
+
+        unknown = False
+        for change in changes:
+            pos = int(change['cpos'])
+            song_id = change['id']
+            if pos >= length:
+                continue
+            if song_id in known:
+                queue.set(pos, song_id, known[song_id])
+            else:
+                unknown = True
+
+        if unknown:
+            for song in self._client.plchanges(queue.version):
+                pos = int(song.get('pos', -1))
+                if 0 <= pos < length:
+                    queue.set(pos, song.get('id'), _song_duration(song))
+
+        queue.version = version
+        log.debug("Queue summary updated to version %s: %d changed positions", version, len(changes))
+
+
+class MPDIdleWatcher:
+    SUBSYSTEMS = ('player', 'mixer', 'options', 'playlist')
+    IDLE_TIMEOUT = 300
+    STOP_TIMEOUT = 2.0
+    MIN_RETRY_DELAY = 0.5
+
+    def __init__(self, host='localhost', port=6600, wakeup=None, timeout=None):
+        self.host = host
+        self.port = port
+        self._client = _base_client(timeout)
+        self._client.idletimeout = self.IDLE_TIMEOUT
+        self._connected = False
+        self._retry_interval = 5
+        self._retry_delay = self.MIN_RETRY_DELAY
+        self._wakeup = wakeup or threading.Event()
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._socket_lock = threading.Lock()
+        self._changes = set()
+        self._thread = None
+        log.debug(f"MPD idle watcher initialized for {host}:{port}")
+
+    @property
+    def connected(self):
+        return self._connected
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="mpd-idle", daemon=True)
+        self._thread.start()
+        log.debug("MPD idle watcher started")
+
+    def stop(self):
+        self._stop_event.set()
+        self._interrupt()
+        if self._thread:
+            self._thread.join(timeout=self.STOP_TIMEOUT)
+            self._thread = None
+        self._disconnect()
+        log.debug("MPD idle watcher stopped")
+
+    def take_changes(self):
+        with self._lock:
+            changes = self._changes
+            self._changes = set()
+        return changes
+
+    def _notify(self, subsystems):
+        with self._lock:
+            self._changes.update(subsystems)
+        self._wakeup.set()
+
+    def _connect(self):
+        try:
+            with self._socket_lock:
+                if self._stop_event.is_set():
+                    return False
+                self._client.connect(self.host, self.port)
+                self._connected = True
+            log.ok(f"MPD idle watcher connected to {self.host}:{self.port}")
+            self._notify(self.SUBSYSTEMS)
+        except Exception:
+            self._disconnect()
+            log.error(f"MPD idle watcher failed to connect to {self.host}:{self.port}")
+        return self._connected
+
+    def _disconnect(self):
+        with self._socket_lock:
+            try:
+                self._client.disconnect()
+            except Exception:
+                pass
+            if self._connected:
+                self._connected = False
+                self._wakeup.set()
+
+    def _interrupt(self):
+        with self._socket_lock:
+            if not self._connected:
+                return
+            try:
+                sock = socket.fromfd(self._client.fileno(), socket.AF_INET, socket.SOCK_STREAM)
+            except Exception:
+                return
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            finally:
+                sock.close()
+
+    def _back_off(self):
+        self._stop_event.wait(self._retry_delay)
+        self._retry_delay = min(self._retry_delay * 2, self._retry_interval)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            if not self._connected and not self._connect():
+                self._back_off()
+                continue
+            try:
+                changes = self._client.idle(*self.SUBSYSTEMS)
+                self._retry_delay = self.MIN_RETRY_DELAY
+                if changes:
+                    log.debug("MPD idle event: %s", ', '.join(changes))
+                    self._notify(changes)
+            except socket.timeout:
+                log.debug("MPD idle connection quiet for %ds, reconnecting", self.IDLE_TIMEOUT)
+                self._disconnect()
+            except Exception:
+                if self._stop_event.is_set():
+                    break
+                log.error("Lost MPD idle connection")
+                self._disconnect()
+                self._back_off()
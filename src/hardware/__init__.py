@@ -1,9 +1,15 @@
-from .led.controller import LEDController
-from .display.tm1637 import TM1637
-from .button.controller import ButtonController
+from src.utils.lazy import lazy_exports
 from src.utils.logger import Logger
 
 log = Logger()
 log.debug("Initializing hardware components")
 
-__all__ = ["LEDController", "TM1637", "ButtonController"]
+_EXPORTS = {
+    "LEDController": ".led.controller",
+    "TM1637": ".display.tm1637",
+    "DisplayRenderer": ".display.renderer",
+    "ButtonController": ".button.controller"
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(globals(), _EXPORTS)
@@ -1,30 +1,38 @@
 import os
 import time
-import subprocess
-from gpiozero import Button
 from src.core.config import Config
 from src.utils.logger import Logger
 
 log = Logger()
 
 class ButtonController:
-    def __init__(self):
+    def __init__(self, on_short_press=None, on_long_press=None):
         log.debug("Initializing button controller")
         self.config = Config()
+        self.on_short_press = on_short_press
+        self.on_long_press = on_long_press
         self.button = None
         self._setup_button()
         self.last_command_time = 0
         self.press_start_time = None
         
         log.info("Loading button timings...")
-        self.command_cooldown = self.config.get('timing.command_cooldown', 0.5)
-        self.long_press_time = self.config.get('timing.long_press_time', 2)
+        self._command_cooldown = self.config.setting('timing.command_cooldown', 0.5, float)
+        self._long_press_time = self.config.setting('timing.long_press_time', 2, float)
         
         log.info("Registering button handlers...")
         self._setup_button()
         
         log.ok("Button controller initialized")
 
+    @property
+    def command_cooldown(self):
+        return self._command_cooldown()
+
+    @property
+    def long_press_time(self):
+        return self._long_press_time()
+
     def _setup_button(self):
         log.info("Setting up button hardware...")
         try:
@@ -37,6 +45,7 @@ class ButtonController:
                 log.error("Button pin not configured")
                 return
 
+            from gpiozero import Button
             self.button = Button(
                 button_pin,
                 pull_up=True,
@@ -73,39 +82,34 @@ class ButtonController:
         log.debug("Button: Short press detected")
         self.last_command_time = time.time()
         script_path = self.config.get('paths.roulette')
-        
-        if not script_path:
+        if script_path:
+            self._run_script(script_path, 'roulette')
+        elif self.on_short_press:
+            self.on_short_press()
+        else:
             log.error("Script configuration not found")
-            return
-        
-        if not os.path.exists(script_path):
-            log.error(f"Script not found: {script_path} (roulette)")
-            return
-        
-        try:
-            log.wait("Executing roulette script")
-            subprocess.run(['sudo', script_path], check=True)
-            log.ok("Roulette script executed")
-        except subprocess.CalledProcessError:
-            log.error("Script execution failed")
 
     def _execute_long_press(self):
         log.debug("Button: Long press detected")
         self.last_command_time = time.time()
         script_path = self.config.get('paths.shutdown')
-        
-        if not script_path:
+        if script_path:
+            self._run_script(script_path, 'shutdown')
+        elif self.on_long_press:
+            self.on_long_press()
+        else:
             log.error("Script configuration not found")
-            return
-        
+
+    def _run_script(self, script_path, name):
         if not os.path.exists(script_path):
-            log.error(f"Script not found: {script_path} (shutdown)")
+            log.error(f"Script not found: {script_path} ({name})")
             return
         
+        import subprocess
         try:
-            log.wait("Executing shutdown script")
+            log.wait(f"Executing {name} script")
             subprocess.run(['sudo', script_path], check=True)
-            log.ok("Shutdown script executed")
+            log.ok(f"{name.capitalize()} script executed")
         except subprocess.CalledProcessError:
             log.error("Script execution failed")
 
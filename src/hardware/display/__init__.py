@@ -1,7 +1,8 @@
 from .tm1637 import TM1637
+from .renderer import DisplayRenderer
 from src.utils.logger import Logger
 
 log = Logger()
 log.debug("Initializing display module")
 
-__all__ = ["TM1637"]
+__all__ = ["TM1637", "DisplayRenderer"]
@@ -0,0 +1,153 @@
+import time
+from src.utils.logger import Logger
+
+log = Logger()
+
+CLK = 0x01
+DIO = 0x02
+
+def _byte_levels(data):
+    levels = []
+    previous = None
+    for _ in range(8):
+        bit = DIO if data & 1 else 0
+        if previous is not None and previous != bit:
+            levels.append(previous)
+        levels.append(bit)
+        levels.append(bit | CLK)
+        previous = bit
+        data >>= 1
+    if previous != DIO:
+        levels.append(previous)
+    levels.extend((DIO, DIO | CLK, DIO))
+    return tuple(levels)
+
+BYTE_LEVELS = tuple(_byte_levels(value) for value in range(256))
+START_LEVELS = (DIO | CLK, CLK, 0)
+STOP_LEVELS = (0, CLK, DIO | CLK)
+
+def transaction_levels(transactions):
+    levels = []
+    for transaction in transactions:
+        levels.extend(START_LEVELS)
+        for data in transaction:
+            levels.extend(BYTE_LEVELS[data])
+        levels.extend(STOP_LEVELS)
+    return levels
+
+class GpiozeroBackend:
+    name = 'gpiozero'
+
+    def __init__(self, clk_pin, dio_pin, options=None):
+        from gpiozero import DigitalOutputDevice
+        self.clk = DigitalOutputDevice(clk_pin)
+        self.dio = DigitalOutputDevice(dio_pin)
+
+    def _start(self):
+        self.dio.on()
+        self.clk.on()
+        self.dio.off()
+        self.clk.off()
+
+    def _stop(self):
+        self.clk.off()
+        self.dio.off()
+        self.clk.on()
+        self.dio.on()
+
+    def _write_byte(self, data):
+        for _ in range(8):
+            self.clk.off()
+            self.dio.value = data & 1
+            data >>= 1
+            self.clk.on()
+
+        self.clk.off()
+        self.dio.on()
+        self.clk.on()
+        self.clk.off()
+
+    def send(self, transactions):
+        for transaction in transactions:
+            self._start()
+            for data in transaction:
+                self._write_byte(data)
+            self._stop()
+
+    def close(self):
+        self.clk.close()
+        self.dio.close()
+
+class LgpioBackend:
+    name = 'lgpio'
+    MODES = ('group', 'wave')
+
+    def __init__(self, clk_pin, dio_pin, options=None):
+        import lgpio
+        options = options or {}
+        self._lgpio = lgpio
+        self.clk_pin = clk_pin
+        self.mode = options.get('mode', 'group')
+        if self.mode not in self.MODES:
+            log.warning(f"Unknown lgpio display mode '{self.mode}', using 'group'")
+            self.mode = 'group'
+        self.pulse_us = options.get('pulse_us', 5)
+        self._handle = lgpio.gpiochip_open(options.get('chip', 0))
+        try:
+            lgpio.group_claim_output(self._handle, [clk_pin, dio_pin], [1, 1])
+        except Exception:
+            lgpio.gpiochip_close(self._handle)
+            raise
+        self._level = CLK | DIO
+
+    def send(self, transactions):
+        levels = transaction_levels(transactions)
+        if self.mode == 'wave':
+            self._send_wave(levels)
+        else:
+            self._send_group(levels)
+
+    def _send_group(self, levels):
+        group_write = self._lgpio.group_write
+        handle = self._handle
+        clk_pin = self.clk_pin
+        level = self._level
+        for next_level in levels:
+            if next_level != level:
+                group_write(handle, clk_pin, next_level, CLK | DIO)
+                level = next_level
+        self._level = level
+
+    def _send_wave(self, levels):
+        lgpio = self._lgpio
+        pulses = [lgpio.pulse(level, CLK | DIO, self.pulse_us) for level in levels]
+        lgpio.tx_wave(self._handle, self.clk_pin, pulses)
+        while lgpio.tx_busy(self._handle, self.clk_pin, lgpio.TX_WAVE):
+            time.sleep(0.0001)
+        if levels:
+            self._level = levels[-1]
+
+    def close(self):
+        try:
+            self._lgpio.group_free(self._handle, self.clk_pin)
+        finally:
+            self._lgpio.gpiochip_close(self._handle)
+
+BACKENDS = {
+    GpiozeroBackend.name: GpiozeroBackend,
+    LgpioBackend.name: LgpioBackend
+}
+
+def create_backend(name, clk_pin, dio_pin, options=None):
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        log.warning(f"Unknown display backend '{name}', using gpiozero")
+        backend_class = GpiozeroBackend
+
+    if backend_class is not GpiozeroBackend:
+        try:
+            return backend_class(clk_pin, dio_pin, options)
+        except Exception as e:
+            log.warning(f"Display backend '{name}' unavailable ({e}), using gpiozero")
+
+    return GpiozeroBackend(clk_pin, dio_pin, options)
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import namedtuple
+from src.hardware.display.tm1637 import TM1637
+from src.utils.logger import Logger
+
+log = Logger()
+
+Scene = namedtuple('Scene', ['frame', 'alt_frame', 'interval'])
+
+class DisplayRenderer:
+    def __init__(self, display=None):
+        log.debug("Initializing display renderer")
+        self.display = display or TM1637()
+        self._condition = threading.Condition()
+        self._pending = None
+        self._keep_phase = False
+        self._brightness_requested = False
+        self._running = True
+        self._scene = None
+        self._scene_started = 0
+        self._thread = threading.Thread(target=self._run, name="display-render", daemon=True)
+        self._thread.start()
+        log.ok("Display renderer started")
+
+    @property
+    def brightness(self):
+        return self.display._brightness
+
+    @property
+    def scene(self):
+        with self._condition:
+            return self._pending or self._scene
+
+    def submit(self, frame, alt_frame=None, interval=0, keep_phase=False):
+        if frame is None:
+            return
+        scene = Scene(frame, alt_frame if alt_frame is not None else frame, interval)
+        with self._condition:
+            self._pending = scene
+            self._keep_phase = keep_phase
+            self._condition.notify()
+
+    def show_time(self, minutes, seconds, colon=True, blink_interval=0, colon_interval=0):
+        frame = TM1637.time_frame(minutes, seconds, colon)
+        if frame is None:
+            return
+        if blink_interval:
+            self.submit(frame, TM1637.BLANK_FRAME, blink_interval)
+        elif colon and colon_interval:
+            self.submit(frame, TM1637.time_frame(minutes, seconds, False), colon_interval)
+        else:
+            self.submit(frame)
+
+    def show_dashes(self):
+        self.submit(TM1637.DASH_FRAME)
+
+    def show_boot(self):
+        self.submit(TM1637.BOOT_FRAME)
+
+    def clear(self):
+        self.submit(TM1637.BLANK_FRAME)
+
+    def show_track_total(self, count):
+        self.submit(TM1637.track_total_frame(count))
+
+    def show_track_number(self, number):
+        self.submit(TM1637.track_number_frame(number))
+
+    def show_volume(self, number):
+        self.submit(TM1637.volume_frame(number))
+
+    def show_progress(self, percent, mb_per_second, interval=2.0):
+        frame = TM1637.progress_frame(percent)
+        self.submit(frame, TM1637.rate_frame(mb_per_second), interval, keep_phase=True)
+
+    def update_brightness(self):
+        with self._condition:
+            self._brightness_requested = True
+            self._condition.notify()
+
+    def _run(self):
+        timeout = None
+        while True:
+            with self._condition:
+                if self._running and self._pending is None and not self._brightness_requested:
+                    self._condition.wait(timeout)
+                if not self._running:
+                    break
+                pending = self._pending
+                keep_phase = self._keep_phase
+                self._pending = None
+                brightness_requested = self._brightness_requested
+                self._brightness_requested = False
+
+            try:
+                if brightness_requested:
+                    self.display.update_brightness()
+                if pending is not None and pending != self._scene:
+                    if not (keep_phase and self._scene and self._scene.interval == pending.interval):
+                        self._scene_started = time.monotonic()
+                    self._scene = pending
+                timeout = self._draw()
+            except Exception as e:
+                log.error(f"Display render failed: {e}")
+                self.display.invalidate()
+                timeout = 1.0
+
+    def _draw(self):
+        scene = self._scene
+        if scene is None:
+            return None
+
+        if not scene.interval:
+            self.display.show_frame(scene.frame)
+            return None
+
+        elapsed = time.monotonic() - self._scene_started
+        phase = int(elapsed / scene.interval)
+        self.display.show_frame(scene.frame if phase % 2 == 0 else scene.alt_frame)
+        return (phase + 1) * scene.interval - elapsed
+
+    def cleanup(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join(timeout=2)
+        self.display.cleanup()
@@ -1,76 +1,105 @@
-from gpiozero import DigitalOutputDevice
 import time
 from src.core.config import Config
+from src.hardware.display.backends import create_backend
 from src.utils.logger import Logger
 
 log = Logger()
 
+def _build_frame_tables(char_map, colon_bit):
+    digits = [char_map[str(d)] for d in range(10)]
+    dash = bytes((char_map['-'],))
+    pairs = [bytes((digits[n // 10], digits[n % 10])) for n in range(100)]
+    colon = bytes(seg | colon_bit for seg in range(256))
+
+    time_frames = tuple(minutes + seconds for minutes in pairs for seconds in pairs[:60])
+    time_colon_frames = tuple(frame.translate(colon) for frame in time_frames)
+    track_frames = tuple(dash + pair + dash for pair in pairs)
+    total_frames = tuple(pair + dash + dash for pair in pairs)
+    volume_frames = tuple(dash + dash + pair for pair in pairs) + (
+        dash + bytes((digits[1], digits[0], digits[0])),)
+
+    return time_frames, time_colon_frames, track_frames, total_frames, volume_frames
+
 class TM1637:
     COMMAND1 = 0x40
+    COMMAND1_FIXED = 0x44
     COMMAND2 = 0xC0
     COMMAND3 = 0x80
     DSP_ON = 0x08
     COLON_BIT = 0x80
+    DIGITS = 4
+    MAX_FIXED_WRITES = 2
 
     CHAR_MAP = {
         '0': 0x3F, '1': 0x06, '2': 0x5B, '3': 0x4F, '4': 0x66,
         '5': 0x6D, '6': 0x7D, '7': 0x07, '8': 0x7F, '9': 0x6F,
-        '-': 0x40, ' ': 0x00
+        '-': 0x40, ' ': 0x00, 'P': 0x73, 'r': 0x50,
+        'b': 0x7C, 'o': 0x5C, 't': 0x78
     }
 
+    (TIME_FRAMES, TIME_COLON_FRAMES, TRACK_FRAMES,
+     TOTAL_FRAMES, VOLUME_FRAMES) = _build_frame_tables(CHAR_MAP, COLON_BIT)
+    DASH_FRAME = bytes([CHAR_MAP['-']] * 4)
+    BLANK_FRAME = bytes(4)
+    BOOT_FRAME = bytes([CHAR_MAP['b'], CHAR_MAP['o'], CHAR_MAP['o'], CHAR_MAP['t']])
+
     def __init__(self):
         log.debug("Initializing display controller")
         self.config = Config()
+        self._brightness_setting = self.config.setting('display.brightness', 2, int)
         self._setup_display()
         log.ok("Display controller initialized")
 
     def _setup_display(self):
         log.info("Setting up display hardware...")
         pins = self.config.get('gpio.display')
-        self.clk = DigitalOutputDevice(pins['clk'])
-        self.dio = DigitalOutputDevice(pins['dio'])
-        self._brightness = self.config.get('display.brightness', 2)
+        backend_name = self.config.get('display.backend', 'gpiozero')
+        backend_options = self.config.get('display.lgpio', {})
+        self._backend = create_backend(backend_name, pins['clk'], pins['dio'], backend_options)
+        log.debug(f"Display backend: {self._backend.name}")
+        self._brightness = self._brightness_setting()
+        self._frame = None
+        self._control = None
         self._write_data_command()
         self._write_display_control()
         log.ok("Display hardware initialized")
 
-    def _start(self):
-        self.dio.on()
-        self.clk.on()
-        self.dio.off()
-        self.clk.off()
-
-    def _stop(self):
-        self.clk.off()
-        self.dio.off()
-        self.clk.on()
-        self.dio.on()
-
-    def _write_byte(self, data):
-        for _ in range(8):
-            self.clk.off()
-            self.dio.value = data & 1
-            data >>= 1
-            self.clk.on()
-        
-        self.clk.off()
-        self.dio.on()
-        self.clk.on()
-        self.clk.off()
+    def _write_data_command(self, fixed=False):
+        self._backend.send([(self.COMMAND1_FIXED if fixed else self.COMMAND1,)])
 
-    def _write_data_command(self):
-        self._start()
-        self._write_byte(self.COMMAND1)
-        self._stop()
+    def _control_transactions(self):
+        control = self.COMMAND3 | self.DSP_ON | self._brightness
+        if control == self._control:
+            return []
+        self._control = control
+        return [(control,)]
 
     def _write_display_control(self):
-        self._start()
-        self._write_byte(self.COMMAND3 | self.DSP_ON | self._brightness)
-        self._stop()
+        transactions = self._control_transactions()
+        if transactions:
+            self._backend.send(transactions)
+
+    @classmethod
+    def frame_transactions(cls, frame, previous=None):
+        if previous is None:
+            changed = range(cls.DIGITS)
+        else:
+            changed = [pos for pos in range(cls.DIGITS) if frame[pos] != previous[pos]]
+
+        if len(changed) <= cls.MAX_FIXED_WRITES:
+            transactions = [(cls.COMMAND1_FIXED,)]
+            transactions.extend((cls.COMMAND2 | pos, frame[pos]) for pos in changed)
+        else:
+            transactions = [(cls.COMMAND1,), (cls.COMMAND2,) + tuple(frame)]
+        return transactions
+
+    def invalidate(self):
+        self._frame = None
+        self._control = None
 
     def update_brightness(self):
         log.debug("Updating display brightness")
-        new_brightness = self.config.get('display.brightness', 2)
+        new_brightness = self._brightness_setting()
         if new_brightness != self._brightness:
             self._brightness = new_brightness
             self._write_data_command()
@@ -85,7 +114,7 @@ class TM1637:
         if not -999 <= number <= 9999:
             return
             
-        log.debug(f"Displaying number: {number}")
+        log.debug("Displaying number: %d", number)
         digits = f"{abs(number):04d}"
         segments = []
         
@@ -96,111 +125,122 @@ class TM1637:
         segments.extend(self.CHAR_MAP[d] for d in digits)
         self._write_segments(segments, colon)
 
-    def show_time(self, minutes, seconds, colon=True):
+    @classmethod
+    def time_frame(cls, minutes, seconds, colon=True):
         if not isinstance(minutes, int) or not isinstance(seconds, int):
-            return
+            return None
             
         if not (0 <= minutes <= 99 and 0 <= seconds <= 59):
-            return
+            return None
 
-        log.debug(f"Displaying time: {minutes:02d}:{seconds:02d}")
-        segments = [
-            self.CHAR_MAP[str(minutes // 10)],
-            self.CHAR_MAP[str(minutes % 10)],
-            self.CHAR_MAP[str(seconds // 10)],
-            self.CHAR_MAP[str(seconds % 10)]
-        ]
-        self._write_segments(segments, colon)
+        frames = cls.TIME_COLON_FRAMES if colon else cls.TIME_FRAMES
+        return frames[minutes * 60 + seconds]
+
+    @classmethod
+    def track_total_frame(cls, count):
+        if not isinstance(count, int) or count < 0 or count > 99:
+            return None
+        return cls.TOTAL_FRAMES[count]
+
+    @classmethod
+    def track_number_frame(cls, number):
+        try:
+            number = int(number)
+            if not 1 <= number <= 99:
+                log.warning(f"Track number out of range: {number}")
+                return None
+            return cls.TRACK_FRAMES[number]
+        except (ValueError, TypeError) as e:
+            log.error(f"Invalid track number format: {e}")
+            return None
+
+    @classmethod
+    def volume_frame(cls, number):
+        try:
+            number = int(number)
+            if not 0 <= number <= 100:
+                return None
+            return cls.VOLUME_FRAMES[number]
+        except (ValueError, TypeError):
+            return None
+
+    @classmethod
+    def _labelled_frame(cls, label, value):
+        digits = str(value).rjust(cls.DIGITS - 1)
+        return bytes(cls.CHAR_MAP[c] for c in label + digits)
+
+    @classmethod
+    def progress_frame(cls, percent):
+        try:
+            percent = int(percent)
+        except (ValueError, TypeError):
+            return None
+        if not 0 <= percent <= 100:
+            return None
+        return cls._labelled_frame('P', percent)
+
+    @classmethod
+    def rate_frame(cls, mb_per_second):
+        try:
+            rate = int(round(mb_per_second))
+        except (ValueError, TypeError):
+            return None
+        return cls._labelled_frame('r', max(0, min(rate, 999)))
+
+    def show_time(self, minutes, seconds, colon=True):
+        frame = self.time_frame(minutes, seconds, colon)
+        if frame is not None:
+            log.debug("Displaying time: %02d:%02d", minutes, seconds)
+            self._write_frame(frame)
 
     def _write_segments(self, segments, colon=False):
-        self._write_data_command()
-        self._start()
-        self._write_byte(self.COMMAND2)
-        
-        for seg in segments:
-            if colon:
-                seg |= self.COLON_BIT
-            self._write_byte(seg)
-        
-        self._stop()
-        self._write_display_control()
+        if colon:
+            frame = bytes(seg | self.COLON_BIT for seg in segments)
+        else:
+            frame = bytes(segments)
+        self._write_frame(frame)
+
+    def show_frame(self, frame):
+        self._write_frame(frame)
+
+    def _write_frame(self, frame):
+        previous = self._frame
+        if frame == previous:
+            return
+
+        transactions = self.frame_transactions(frame, previous)
+        transactions.extend(self._control_transactions())
+        self._backend.send(transactions)
+        self._frame = frame
 
     def clear(self):
         log.debug("Clearing display")
-        self._write_segments([0, 0, 0, 0])
+        self._write_frame(self.BLANK_FRAME)
 
     def cleanup(self):
         log.info("Shutting down display...")
         self.clear()
-        self.clk.close()
-        self.dio.close()
+        self._backend.close()
         log.ok("Display shutdown complete")
 
     def show_dashes(self):
         log.debug("Showing dashes")
-        segments = [self.CHAR_MAP['-']] * 4
-        self._write_segments(segments, False)
+        self._write_frame(self.DASH_FRAME)
 
     def show_track_total(self, count):
-        if not isinstance(count, int) or count < 0 or count > 99:
-            return
-            
-        log.debug(f"Showing track total: {count}")
-        segments = [
-            self.CHAR_MAP[str(count // 10)],
-            self.CHAR_MAP[str(count % 10)],
-            self.CHAR_MAP['-'],
-            self.CHAR_MAP['-']
-        ]
-        self._write_segments(segments, False)
+        frame = self.track_total_frame(count)
+        if frame is not None:
+            log.debug("Showing track total: %s", count)
+            self._write_frame(frame)
 
     def show_track_number(self, number: int) -> None:
-        try:
-            number = int(number)
-            if not 1 <= number <= 99:
-                log.warning(f"Track number out of range: {number}")
-                return
-            
-            log.debug(f"Showing track number: {number}")
-            num_str = f"{number:02d}"
-            
-            segments = [
-                self.CHAR_MAP['-'],
-                self.CHAR_MAP[num_str[0]],
-                self.CHAR_MAP[num_str[1]],
-                self.CHAR_MAP['-']
-            ]
-            
-            self._write_segments(segments, False)
-            
-        except (ValueError, TypeError) as e:
-            log.error(f"Invalid track number format: {e}")
-            return
+        frame = self.track_number_frame(number)
+        if frame is not None:
+            log.debug("Showing track number: %s", number)
+            self._write_frame(frame)
 
     def show_volume(self, number):
-        try:
-            number = int(number)
-            if not 0 <= number <= 100:
-                return
-                
-            log.debug(f"Showing volume: {number}")
-            if number == 100:
-                segments = [
-                    self.CHAR_MAP['-'],
-                    self.CHAR_MAP['1'],
-                    self.CHAR_MAP['0'],
-                    self.CHAR_MAP['0']
-                ]
-            else:
-                num_str = f"{number:02d}"
-                segments = [
-                    self.CHAR_MAP['-'],
-                    self.CHAR_MAP['-'],
-                    self.CHAR_MAP[num_str[0]],
-                    self.CHAR_MAP[num_str[1]]
-                ]
-                
-            self._write_segments(segments, False)
-            
-        except (ValueError, TypeError):
-            return
+        frame = self.volume_frame(number)
+        if frame is not None:
+            log.debug("Showing volume: %s", number)
+            self._write_frame(frame)
@@ -1,5 +1,3 @@
-from gpiozero import PWMLED
-from gpiozero.pins.lgpio import LGPIOFactory
 from src.core.config import Config
 from src.utils.logger import Logger
 
@@ -15,7 +13,10 @@ class LEDController:
         self.pwm_frequency = pwm_config.get('frequency', 1000)
         
         self._brightness_cache = None
+        self._brightness_generation = None
         
+        from gpiozero import PWMLED
+        from gpiozero.pins.lgpio import LGPIOFactory
         pin_factory = LGPIOFactory()
         
         self.leds = {
@@ -42,14 +43,19 @@ class LEDController:
         log.ok("LED controller initialized")
         self._last_status = {}
 
-    def _setup_leds(self):
-        try:
+    def _led_brightness(self):
+        if self._brightness_generation != self.config.generation:
             display_level = self.config.get('display.brightness', 0)
             display_levels = self.config.get('display.brightness_levels.display', [0, 2, 7])
             led_levels = self.config.get('display.brightness_levels.led', [5, 25, 100])
-            
             index = display_levels.index(display_level)
-            brightness = led_levels[index] / 100.0
+            self._brightness_cache = led_levels[index] / 100.0
+            self._brightness_generation = self.config.generation
+        return self._brightness_cache
+
+    def _setup_leds(self):
+        try:
+            brightness = self._led_brightness()
             
             for led_info in self.leds.values():
                 if led_info['state']:
@@ -72,22 +78,30 @@ class LEDController:
         }
         
         if state_map != self._last_status:
-            if self._brightness_cache is None:
-                display_level = self.config.get('display.brightness', 0)
-                display_levels = self.config.get('display.brightness_levels.display', [0, 2, 7])
-                led_levels = self.config.get('display.brightness_levels.led', [5, 25, 100])
-                index = display_levels.index(display_level)
-                self._brightness_cache = led_levels[index] / 100.0
+            brightness = self._led_brightness()
             
             for led_name, state in state_map.items():
                 if state != self._last_status.get(led_name):
                     led_info = self.leds.get(led_name)
                     if led_info:
                         led_info['state'] = state
-                        led_info['led'].value = self._brightness_cache if state else 0
+                        led_info['led'].value = brightness if state else 0
                         
             self._last_status = state_map.copy()
 
+    @property
+    def states(self):
+        return {name: led_info['state'] for name, led_info in self.leds.items()}
+
+    def restore(self, states):
+        brightness = self._led_brightness()
+        for led_name, state in states.items():
+            led_info = self.leds.get(led_name)
+            if led_info:
+                led_info['state'] = bool(state)
+                led_info['led'].value = brightness if state else 0
+        self._last_status = self.states
+
     def all_off(self):
         log.debug("Turning off all LEDs")
         for led_info in self.leds.values():
@@ -102,4 +116,4 @@ class LEDController:
         log.ok("LED controller shutdown complete")
 
     def invalidate_brightness_cache(self):
-        self._brightness_cache = None
+        self._brightness_generation = None
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 import sys
 import os
+import time
+
+STARTED = time.monotonic()
 
 PROJECT_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
-from service.player_service import PlayerService
-from utils.logger import Logger
+from src.service.player_service import PlayerService
+from src.utils.logger import Logger
 
 log = Logger()
 
@@ -26,7 +29,7 @@ def main():
     
     try:
         log.wait("Initializing player service")
-        service = PlayerService()
+        service = PlayerService(STARTED)
         log.ok("Player service is ready")
         
         service.start()
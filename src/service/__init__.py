@@ -1,8 +1,16 @@
-from .player_service import PlayerService
-from .usb_copy_service import USBCopyService
+from src.utils.lazy import lazy_exports
 from src.utils.logger import Logger
 
 log = Logger()
 log.debug("Initializing service components")
 
-__all__ = ["PlayerService", "USBCopyService"]
+_EXPORTS = {
+    "PlayerService": ".player_service",
+    "USBCopyService": ".usb_copy_service",
+    "CopyQueue": ".copy_queue",
+    "ControlServer": ".control",
+    "send_command": ".control"
+}
+
+__all__ = list(_EXPORTS)
+__getattr__ = lazy_exports(globals(), _EXPORTS)
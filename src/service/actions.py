@@ -0,0 +1,63 @@
+import time
+from src.utils.logger import Logger
+
+log = Logger()
+
+MPD_OPTIONS = ('random', 'repeat', 'single', 'consume')
+DISPLAY_MODES = ('elapsed', 'remaining')
+ROULETTE_MODES = ('tracks', 'album')
+
+def toggle_option(mpd, option):
+    if option not in MPD_OPTIONS:
+        raise ValueError(f"Unknown playback option: {option}")
+    enabled = mpd.toggle_option(option)
+    log.ok(f"{option.capitalize()} mode {'enabled' if enabled else 'disabled'}")
+    return enabled
+
+def cycle_brightness(config):
+    current = config.get('display.brightness', 4)
+    levels = list(config.get('display.brightness_levels.display', [2, 4, 7]))
+    next_level = levels[(levels.index(current) + 1) % len(levels)] if current in levels else levels[0]
+    log.info(f"Changing brightness from {current} to {next_level}")
+    config.update('display.brightness', next_level)
+    log.ok(f"Brightness updated to {next_level}")
+    return next_level
+
+def toggle_display_mode(config):
+    current_mode = config.get('display.mode', DISPLAY_MODES[0])
+    new_mode = DISPLAY_MODES[1] if current_mode == DISPLAY_MODES[0] else DISPLAY_MODES[0]
+    log.info(f"Changing display mode from {current_mode} to {new_mode}")
+    config.update('display.mode', new_mode)
+    log.ok(f"Display mode updated to {new_mode}")
+    return new_mode
+
+def start_roulette(mpd, mode='tracks'):
+    if mode not in ROULETTE_MODES:
+        raise ValueError(f"Unknown roulette mode: {mode}")
+    if mode == 'album':
+        log.info("Starting album random mode...")
+        mpd.execute(('consume', 0))
+        command = ['ashuffle', '--group-by', 'album']
+    else:
+        log.info("Starting random mode...")
+        mpd.execute(('repeat', 0), ('single', 0), ('random', 0), ('consume', 1))
+        command = ['ashuffle']
+
+    import subprocess
+    subprocess.run(['sudo', 'pkill', '-f', 'ashuffle'], check=False)
+    mpd.execute('clear')
+    subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
+    log.ok("Album random mode activated" if mode == 'album' else "Random mode activated")
+
+def shutdown(mpd):
+    log.info("Starting shutdown process...")
+    log.wait("Stopping playback...")
+    try:
+        mpd.execute('stop')
+    except Exception as e:
+        log.warning(f"Unable to stop playback: {e}")
+    time.sleep(0.2)
+    log.wait("Shutting down system...")
+    import subprocess
+    subprocess.Popen(['sudo', 'systemctl', 'poweroff'])
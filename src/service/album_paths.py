@@ -0,0 +1,31 @@
+import os
+from src.utils.logger import Logger
+
+log = Logger()
+
+def album_paths(file_path, path_structure, skip_folders):
+    if '://' in file_path:
+        return None
+    if os.path.isdir(os.path.join(path_structure['music_root'], file_path)):
+        file_path = os.path.join(file_path, '')
+    log.debug(f"File path: {file_path}")
+
+    path_parts = file_path.split('/')
+    if len(path_parts) < path_structure['min_depth']:
+        return None
+    source_dir = os.path.join(
+        path_structure['music_root'],
+        os.path.dirname(file_path)
+    )
+    log.debug(f"Source directory: {source_dir}")
+
+    dest_parts = [part for part in path_parts if part not in skip_folders]
+    log.debug(f"After skip folders: {dest_parts}")
+    if len(dest_parts) < 2:
+        return None
+
+    artist = dest_parts[0]
+    album = dest_parts[1]
+    preserved_path = os.path.join(artist, album)
+    log.debug(f"Preserved path: {preserved_path}")
+    return source_dir, preserved_path
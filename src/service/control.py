@@ -0,0 +1,101 @@
+import os
+import socket
+import threading
+from src.service.control_protocol import (
+    CLIENT_TIMEOUT, DEFAULT_SOCKET, ControlError, encode_message, read_message, request
+)
+from src.utils.logger import Logger
+
+log = Logger()
+
+ACCEPT_TIMEOUT = 1.0
+SOCKET_MODE = 0o660
+
+def send_command(path, command, timeout=CLIENT_TIMEOUT, **args):
+    response = request(path, command, args, timeout)
+    if not response.get('ok'):
+        raise ControlError(response.get('error', 'Command failed'))
+    return response
+
+class ControlServer:
+    def __init__(self, path=DEFAULT_SOCKET, handlers=None):
+        self.path = path
+        self.handlers = dict(handlers or {})
+        self._stop_event = threading.Event()
+        self._socket = None
+        self._thread = None
+
+    def register(self, command, handler):
+        self.handlers[command] = handler
+
+    def start(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), mode=0o750, exist_ok=True)
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(self.path)
+            os.chmod(self.path, SOCKET_MODE)
+            sock.listen(4)
+            sock.settimeout(ACCEPT_TIMEOUT)
+        except OSError as e:
+            log.warning(f"Control socket unavailable at {self.path}: {e}")
+            return False
+        self._socket = sock
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="control", daemon=True)
+        self._thread.start()
+        log.debug(f"Listening for commands on {self.path}")
+        return True
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=ACCEPT_TIMEOUT * 2)
+            self._thread = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                conn, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            except OSError as e:
+                if not self._stop_event.is_set():
+                    log.error(f"Control socket failed: {e}")
+                return
+            with conn:
+                try:
+                    self._serve(conn)
+                except (OSError, ValueError) as e:
+                    log.warning(f"Dropped control request: {e}")
+
+    def _serve(self, conn):
+        conn.settimeout(CLIENT_TIMEOUT)
+        with conn.makefile('rb') as stream:
+            message = read_message(stream)
+        if message is None:
+            return
+        conn.sendall(encode_message(self._dispatch(message)))
+
+    def _dispatch(self, request):
+        command = request.get('command') if isinstance(request, dict) else None
+        handler = self.handlers.get(command)
+        if handler is None:
+            return {'ok': False, 'error': f"Unknown command: {command}"}
+        log.debug("Control command: %s", command)
+        try:
+            result = handler(**(request.get('args') or {}))
+        except Exception as e:
+            log.error(f"Control command {command} failed: {e}")
+            return {'ok': False, 'error': str(e)}
+        response = {'ok': True}
+        response.update(result or {})
+        return response
@@ -0,0 +1,38 @@
+import json
+import os
+import socket
+
+PROJECT_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+CONFIG_FILE = os.path.join(PROJECT_ROOT, 'config', 'settings.json')
+
+DEFAULT_SOCKET = '/run/adam/adam.sock'
+CLIENT_TIMEOUT = 5.0
+MAX_REQUEST_SIZE = 64 * 1024
+
+class ControlError(Exception):
+    pass
+
+def encode_message(message):
+    return json.dumps(message).encode() + b'\n'
+
+def read_message(stream):
+    line = stream.readline(MAX_REQUEST_SIZE)
+    return json.loads(line) if line else None
+
+def socket_path(config_file=CONFIG_FILE):
+    try:
+        with open(config_file, 'r') as f:
+            return json.load(f).get('control', {}).get('socket', DEFAULT_SOCKET)
+    except (OSError, ValueError):
+        return DEFAULT_SOCKET
+
+def request(path, command, args=None, timeout=CLIENT_TIMEOUT):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(encode_message({'command': command, 'args': args or {}}))
+        with sock.makefile('rb') as stream:
+            response = read_message(stream)
+    if not isinstance(response, dict):
+        raise ControlError("No response from player service")
+    return response
@@ -0,0 +1,58 @@
+import os
+from collections import namedtuple
+from src.utils.storage import plan_directory, plan_size
+from src.utils.logger import Logger
+
+log = Logger()
+
+RESERVED_BYTES = 4 * 1024 * 1024
+
+CopyPlan = namedtuple('CopyPlan', ['selected', 'skipped', 'needed', 'free'])
+
+def unique_albums(albums):
+    sources = set()
+    destinations = set()
+    for source, destination in albums:
+        source = os.path.realpath(source)
+        if source in sources:
+            continue
+        sources.add(source)
+        if destination in destinations:
+            log.warning(f"Skipping {source}: shares destination {destination}")
+            continue
+        destinations.add(destination)
+        yield source, destination
+
+class CopyPlanner:
+    def __init__(self, usb_root, incremental=True, verify=False, reserved=RESERVED_BYTES):
+        self.usb_root = usb_root
+        self.incremental = incremental
+        self.verify = verify
+        self.reserved = reserved
+
+    def free_space(self):
+        usage = os.statvfs(self.usb_root)
+        return usage.f_bavail * usage.f_frsize, usage.f_frsize
+
+    def plan(self, albums):
+        free, block_size = self.free_space()
+        budget = max(0, free - self.reserved)
+        selected, skipped = [], []
+        needed = 0
+        for source, destination in unique_albums(albums):
+            try:
+                album = plan_directory(source, destination, self.incremental, self.verify)
+            except FileNotFoundError:
+                log.warning(f"Skipping missing album: {source}")
+                continue
+            size = plan_size(album, block_size)
+            if needed + size > budget:
+                log.warning(f"Not enough space for {os.path.relpath(destination, self.usb_root)} "
+                            f"({size/1024/1024:.1f} MB needed, {(budget - needed)/1024/1024:.1f} MB left)")
+                skipped.append(album)
+                continue
+            needed += size
+            selected.append(album)
+        log.info(f"Copy plan: {len(selected)} albums, {needed/1024/1024:.1f} MB "
+                 f"of {free/1024/1024:.1f} MB free")
+        return CopyPlan(selected, skipped, needed, free)
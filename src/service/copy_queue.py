@@ -0,0 +1,173 @@
+import os
+import threading
+from collections import deque, namedtuple
+from src.core.config import Config
+from src.service.album_paths import album_paths
+from src.utils.logger import Logger
+
+log = Logger()
+
+CopyJob = namedtuple('CopyJob', ['job_id', 'files', 'mirror'])
+
+def _io_classes(psutil):
+    if not hasattr(psutil, 'IOPRIO_CLASS_IDLE'):
+        return {}
+    return {
+        'idle': (psutil.IOPRIO_CLASS_IDLE, None),
+        'best-effort': (psutil.IOPRIO_CLASS_BE, 7)
+    }
+
+class CopyQueue:
+    def __init__(self, display=None, mount_watcher=None, wakeup=None):
+        log.debug("Initializing copy queue")
+        self.config = Config()
+        self.display = display
+        self.mount_watcher = mount_watcher
+        self._wakeup = wakeup
+        self._condition = threading.Condition()
+        self._jobs = deque()
+        self._job_albums = {}
+        self._active = None
+        self._next_id = 1
+        self._running = False
+        self._service = None
+        self._thread = None
+
+    @property
+    def busy(self):
+        return self._active is not None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="copy-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._jobs.clear()
+            self._job_albums.clear()
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=2)
+            if self._thread.is_alive():
+                log.warning("Copy job still running at shutdown")
+            self._thread = None
+
+    def _resolve(self, files):
+        if files is None:
+            return None
+        copy_config = self.config.get('copy', {})
+        path_structure = copy_config.get('path_structure', {})
+        skip_folders = copy_config.get('destination_skip_folders', [])
+        albums = set()
+        for file_path in files:
+            try:
+                paths = album_paths(file_path, path_structure, skip_folders)
+            except KeyError:
+                paths = None
+            if paths is None:
+                albums.add((os.path.normpath(file_path), None))
+            else:
+                albums.add((os.path.realpath(paths[0]), paths[1]))
+        return frozenset(albums)
+
+    def _covers(self, job, albums, mirror):
+        if job.mirror != mirror:
+            return False
+        queued = self._job_albums.get(job.job_id)
+        if albums is None or queued is None:
+            return albums is None and queued is None
+        return albums <= queued
+
+    def submit(self, files=None, mirror=False):
+        files = tuple(files) if files is not None else None
+        albums = self._resolve(files)
+        with self._condition:
+            pending = ([self._active] if self._active else []) + list(self._jobs)
+            for position, job in enumerate(pending):
+                if self._covers(job, albums, mirror):
+                    log.info(f"Copy already queued as job {job.job_id}")
+                    return job, position
+            job = CopyJob(self._next_id, files, mirror)
+            self._next_id += 1
+            position = len(pending)
+            self._jobs.append(job)
+            self._job_albums[job.job_id] = albums
+            self._condition.notify()
+        if files is None:
+            log.info(f"Queued copy job {job.job_id}: current queue")
+        else:
+            log.info(f"Queued copy job {job.job_id}: {len(albums)} albums")
+        return job, position
+
+    def status(self):
+        with self._condition:
+            active = self._active
+            queued = list(self._jobs)
+        return {
+            'active': active._asdict() if active else None,
+            'queued': [job._asdict() for job in queued]
+        }
+
+    def _lower_priority(self):
+        priority = self.config.get('copy.priority', {})
+        thread_id = threading.get_native_id()
+        nice = priority.get('nice', 10)
+        try:
+            os.setpriority(os.PRIO_PROCESS, thread_id, nice)
+        except (OSError, AttributeError) as e:
+            log.warning(f"Unable to set copy worker nice level: {e}")
+
+        try:
+            import psutil
+        except ImportError as e:
+            log.warning(f"Unable to set copy worker I/O priority: {e}")
+            return
+        io_classes = _io_classes(psutil)
+        io_class = priority.get('io_class', 'idle')
+        if io_class not in io_classes:
+            log.warning(f"Unsupported copy I/O class: {io_class}")
+            return
+        try:
+            psutil.Process(thread_id).ionice(*io_classes[io_class])
+        except (psutil.Error, OSError) as e:
+            log.warning(f"Unable to set copy worker I/O priority: {e}")
+            return
+        log.debug(f"Copy worker running at nice {nice}, I/O class {io_class}")
+
+    def _run(self):
+        try:
+            self._lower_priority()
+        except Exception as e:
+            log.warning(f"Unable to lower copy worker priority: {e}")
+        while True:
+            with self._condition:
+                while self._running and not self._jobs:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                job = self._jobs.popleft()
+                self._active = job
+
+            try:
+                self._copy(job)
+                log.ok(f"Copy job {job.job_id} finished")
+            except Exception as e:
+                log.error(f"Copy job {job.job_id} failed: {e}")
+            finally:
+                with self._condition:
+                    self._active = None
+                    self._job_albums.pop(job.job_id, None)
+                if self._wakeup:
+                    self._wakeup.set()
+
+    def _copy(self, job):
+        if self._service is None:
+            from src.service.usb_copy_service import USBCopyService
+            self._service = USBCopyService(self.display, self.mount_watcher)
+        log.info(f"Starting copy job {job.job_id}")
+        if job.files is None:
+            self._service.copy_queue(job.mirror)
+        else:
+            self._service.copy_albums(job.files, job.mirror)
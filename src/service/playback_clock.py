@@ -0,0 +1,55 @@
+import math
+import time
+
+EDGE_MARGIN = 0.005
+
+class PlaybackClock:
+    def __init__(self):
+        self.running = False
+        self.duration = 0.0
+        self._elapsed = 0.0
+        self._anchor = time.monotonic()
+
+    def sync(self, status):
+        try:
+            elapsed = float(status.get('elapsed', 0))
+        except (ValueError, TypeError):
+            elapsed = 0.0
+        try:
+            duration = float(status.get('duration', 0))
+        except (ValueError, TypeError):
+            duration = 0.0
+
+        self._elapsed = elapsed
+        self._anchor = time.monotonic()
+        self.duration = duration
+        self.running = status.get('state') == 'play'
+
+    def elapsed(self, now=None):
+        if not self.running:
+            return self._elapsed
+        if now is None:
+            now = time.monotonic()
+        elapsed = self._elapsed + (now - self._anchor)
+        if self.duration > 0:
+            elapsed = min(elapsed, self.duration)
+        return elapsed
+
+    def remaining(self, now=None):
+        return max(0.0, self.duration - self.elapsed(now))
+
+    def has_duration(self):
+        return self.duration > 0
+
+    def time_to_next_second(self, remaining=False, now=None):
+        if not self.running:
+            return 1.0
+        if remaining and self.has_duration():
+            value = self.remaining(now)
+            delay = value - math.floor(value)
+        else:
+            value = self.elapsed(now)
+            delay = math.ceil(value) - value
+        if delay <= 0:
+            delay = 1.0
+        return delay + EDGE_MARGIN
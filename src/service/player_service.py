@@ -2,42 +2,171 @@ import time
 import signal
 import os
 import sys
+import threading
+from collections import deque
+from functools import partial
 from src.core.config import Config
-from src.core.mpd_client import MPDClient
+from src.core.config_watcher import ConfigWatcher
+from src.core.mpd_client import MPDClient, MPDIdleWatcher
 from src.hardware.led.controller import LEDController
-from src.hardware.display.tm1637 import TM1637
+from src.hardware.display.renderer import DisplayRenderer
 from src.hardware.button.controller import ButtonController
+from src.service import actions
+from src.service.control import ControlServer, DEFAULT_SOCKET
+from src.service.copy_queue import CopyQueue
+from src.service.playback_clock import PlaybackClock
+from src.service.state_store import StateStore, DEFAULT_PATH, encode_scene, decode_scene
+from src.utils.mounts import MountWatcher
 from src.utils.logger import Logger
 
 log = Logger()
 
 PROJECT_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
+COMMAND_TIMEOUT = 5.0
+
 DISPLAY_MODES = {
     'ELAPSED': 'elapsed',
     'REMAINING': 'remaining'
 }
 
+def _start_task(name, fn, *args):
+    from concurrent import futures
+    future = futures.Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f"init-{name}", daemon=True).start()
+    return future
+
+def _task_result(future, name):
+    if not future.done():
+        raise RuntimeError(f"{name} did not initialize in time")
+    return future.result()
+
 class PlayerService:
-    def __init__(self):
+    def __init__(self, started=None):
         log.debug("Initializing player service")
+        self._started = started if started is not None else time.monotonic()
         self.config = Config()
-        self.mpd = MPDClient()
+        mpd_host = self.config.get('mpd.host', 'localhost')
+        mpd_port = self.config.get('mpd.port', 6600)
+        mpd_timeout = self.config.get('mpd.timeout', 5)
+        self.mpd = MPDClient(mpd_host, mpd_port, mpd_timeout)
+
+        self._wakeup = threading.Event()
+        self._commands = deque()
+        self.idle_watcher = None
+        if self.config.get('mpd.idle.enabled', True):
+            self.idle_watcher = MPDIdleWatcher(mpd_host, mpd_port, self._wakeup, mpd_timeout)
         
+        state_config = self.config.get('state', {})
+        self.state_store = StateStore(state_config.get('path', DEFAULT_PATH))
+        self.state_save_interval = state_config.get('save_interval', 30)
+        self._state_saved_at = time.monotonic()
+        saved_state = self.state_store.load() or {}
+
+        log.info("Setting up display...")
+        self.display = DisplayRenderer()
+        if not self._restore_scene(saved_state, state_config.get('max_age', 60)):
+            self.display.show_boot()
+        log.debug("First frame shown after %.0f ms", self._elapsed_ms())
+
+        if saved_state.get('queue'):
+            self.mpd.restore_queue(saved_state['queue'])
+
         log.info("Setting up hardware controllers...")
-        self.led_controller = LEDController()
-        self.display = TM1637()
-        self.display.show_dashes()
-        self.button_controller = ButtonController()
+        self._init_hardware(self.config.get('timing.init_timeout', 5))
+        if isinstance(saved_state.get('leds'), dict):
+            self.led_controller.restore(saved_state['leds'])
+        
+        self.mount_watcher = MountWatcher()
+        self.copy_queue = CopyQueue(self.display, self.mount_watcher, self._wakeup)
+        self.control = ControlServer(self.config.get('control.socket', DEFAULT_SOCKET), {
+            'copy': self._handle_copy,
+            'copy_status': self.copy_queue.status,
+            'brightness': self._handle_brightness,
+            'display_mode': self._handle_display_mode,
+            'roulette': self._handle_roulette,
+            'shutdown': self._handle_shutdown
+        })
+        for option in actions.MPD_OPTIONS:
+            self.control.register(option, partial(self._handle_option, option))
+        
+        watch_config = self.config.get('updates.watch', {})
+        self.config_watcher = ConfigWatcher(
+            self.config.config_path,
+            self._wakeup,
+            watch_config.get('debounce_time', 0.1),
+            watch_config.get('poll_interval', 1)
+        )
         
         self.running = False
-        self.last_config_check = 0
         self.last_song_id = None
+        self.status = None
+        self.status_time = 0
+        self.current_song = None
+        self.clock = PlaybackClock()
         
         log.info("Loading service configurations...")
         self._load_config()
         log.ok("Player service initialized")
 
+    def _elapsed_ms(self):
+        return (time.monotonic() - self._started) * 1000
+
+    def _init_hardware(self, timeout):
+        from concurrent import futures
+        self._mpd_boot = _start_task('mpd', self.mpd.wait_connected, timeout)
+        self._mpd_boot.add_done_callback(lambda future: self._wakeup.set())
+        leds = _start_task('leds', LEDController)
+        button = _start_task('button', ButtonController, self._on_short_press, self._on_long_press)
+        futures.wait([leds, button], timeout)
+        self.led_controller = _task_result(leds, "LED controller")
+        self.button_controller = _task_result(button, "Button controller")
+        log.debug("Hardware initialized after %.0f ms", self._elapsed_ms())
+
+    def _mpd_ready(self):
+        if self._mpd_boot is None:
+            return True
+        if not self._mpd_boot.done():
+            return False
+        if not self._mpd_boot.result():
+            log.warning("MPD not reachable after boot, retrying in the background")
+            self.display.show_dashes()
+        self._mpd_boot = None
+        return True
+
+    def _restore_scene(self, state, max_age):
+        if not state.get('scene'):
+            return False
+        if self.state_store.age(state) > max_age:
+            log.debug("Saved frame is too old to restore")
+            return False
+        if state.get('display_mode') != self.config.get('display.mode', DISPLAY_MODES['ELAPSED']):
+            return False
+        scene = decode_scene(state['scene'])
+        if scene is None:
+            return False
+        self.display.submit(*scene)
+        log.debug("Restored last frame")
+        return True
+
+    def _save_state(self):
+        self._state_saved_at = time.monotonic()
+        self.state_store.save({
+            'display_mode': self.display_mode,
+            'scene': None if self.copy_queue.busy else encode_scene(self.display.scene),
+            'leds': self.led_controller.states,
+            'queue': self.mpd.queue_snapshot()
+        })
+
     def _load_config(self):
         log.debug("Loading service configuration")
         self.display_mode = self.config.get('display.mode', DISPLAY_MODES['ELAPSED'])
@@ -46,6 +175,7 @@ class PlayerService:
         self.colon_state = False
         self.default_update_interval = self.config.get('timing.update_interval', 0.5)
         self.volume_update_interval = self.config.get('timing.volume_update_interval', 0.1)
+        self.resync_interval = self.config.get('mpd.idle.resync_interval', 30)
         self.stop_display_state = 0
         self.stop_state_changed_at = 0
         self.track_display_until = 0
@@ -56,7 +186,11 @@ class PlayerService:
         log.debug("Loading display configuration")
         self._load_stop_mode_config()
         self.pause_blink_interval = self.config.get('display.pause_mode.blink_interval', 1)
-        self.track_number_time = self.config.get('display.play_mode.track_number_time', 2)
+        self.colon_blink_interval = self.config.get('display.play_mode.colon_blink_interval', 0)
+        self.show_track_numbers = self.config.get('display.play_mode.track_number.show_number', True)
+        self.track_number_time = self.config.get('display.play_mode.track_number.display_time', 2)
+        self.volume_display_duration = self.config.get('timing.volume_display_duration', 3)
+        self._config_generation = self.config.generation
 
     def _load_stop_mode_config(self):
         self.stop_mode_times = {
@@ -65,17 +199,7 @@ class PlayerService:
             'total': self.config.get('display.stop_mode.playlist_time', 2)
         }
 
-    def _handle_config_update(self):
-        log.info("Processing configuration update")
-        
-        self.display_mode = self.config.get('display.mode', DISPLAY_MODES['ELAPSED'])
-        self._load_display_config()
-        
-        status = self.mpd.get_status()
-        if status:
-            self._update_display(status)
-
-    def _update_stop_display(self):
+    def _update_stop_display(self, status):
         current_time = time.time()
         
         current_duration = self.stop_mode_times.get(
@@ -86,19 +210,18 @@ class PlayerService:
         if current_time - self.stop_state_changed_at >= current_duration:
             self.stop_display_state = (self.stop_display_state + 1) % 3
             self.stop_state_changed_at = current_time
-            log.debug(f"Stop display state changed to {self.stop_display_state}")
-        
-        playlist_info = self.mpd.get_playlist_info()
+            log.debug("Stop display state changed to %d", self.stop_display_state)
         
         if self.stop_display_state == 0:
             self.display.show_dashes()
-        elif self.stop_display_state == 1:
-            self.display.show_track_total(playlist_info['total_tracks'])
+            return
+
+        queue_summary = self.mpd.get_queue_summary(status)
+        
+        if self.stop_display_state == 1:
+            self.display.show_track_total(queue_summary['total_tracks'])
         elif self.stop_display_state == 2:
-            total_time = sum(
-                float(track.get('duration', 0)) 
-                for track in playlist_info['tracks']
-            )
+            total_time = queue_summary['total_time']
             minutes = int(total_time) // 60
             seconds = int(total_time) % 60
             self.display.show_time(minutes, seconds, True)
@@ -110,40 +233,19 @@ class PlayerService:
         song_id = current_song.get('id', '0')
         track_number = current_song.get('track', '0')
         
-        track_config = self.config.get('display.play_mode.track_number', {})
-        show_number = track_config.get('show_number', True)
-        display_time = track_config.get('display_time', 2)
-
-        if show_number and ((song_id and song_id != self.last_song_id) or 
+        if self.show_track_numbers and ((song_id and song_id != self.last_song_id) or 
                           (not hasattr(self, '_last_state') or self._last_state != 'play')):
             self.last_song_id = song_id
             
             if track_number.isdigit():
                 track_num = int(track_number)
                 if 1 <= track_num <= 99:
-                    log.debug(f"Track changed to {track_num}")
-                    self.track_display_until = time.time() + display_time
+                    log.debug("Track changed to %d", track_num)
+                    self.track_display_until = time.time() + self.track_number_time
                     self.display.show_track_number(track_num)
 
-    def _update_pause_display(self, elapsed_time, total_time):
-        phase = int(time.time() / self.pause_blink_interval) % 2
-        
-        if phase == 0:
-            try:
-                if self.display_mode == DISPLAY_MODES['REMAINING'] and total_time != 'N/A':
-                    time_value = float(total_time) - float(elapsed_time)
-                else:
-                    time_value = float(elapsed_time)
-                
-                minutes, seconds = self._convert_time_to_minutes_seconds(time_value)
-                if minutes is not None:
-                    self.display.show_time(minutes, seconds, True)
-                else:
-                    self.display.show_dashes()
-            except (ValueError, TypeError):
-                self.display.show_dashes()
-        else:
-            self.display.clear()
+    def _update_pause_display(self):
+        self._update_time_display(blink_interval=self.pause_blink_interval)
 
     def _convert_time_to_minutes_seconds(self, time_value):
         try:
@@ -154,19 +256,21 @@ class PlayerService:
         except (ValueError, TypeError):
             return None, None
 
-    def _update_time_display(self, elapsed_time, total_time):
-        try:
-            if self.display_mode == DISPLAY_MODES['REMAINING'] and total_time != 'N/A':
-                time_value = float(total_time) - float(elapsed_time)
-            else:
-                time_value = float(elapsed_time)
-            
-            minutes, seconds = self._convert_time_to_minutes_seconds(time_value)
-            if minutes is not None:
-                self.display.show_time(minutes, seconds, True)
-            else:
-                self.display.show_dashes()
-        except (ValueError, TypeError):
+    def _showing_remaining(self):
+        return self.display_mode == DISPLAY_MODES['REMAINING'] and self.clock.has_duration()
+
+    def _update_time_display(self, blink_interval=0):
+        if self._showing_remaining():
+            time_value = self.clock.remaining()
+        else:
+            time_value = self.clock.elapsed()
+        
+        minutes, seconds = self._convert_time_to_minutes_seconds(time_value)
+        if minutes is not None:
+            self.display.show_time(minutes, seconds, True,
+                                   blink_interval=blink_interval,
+                                   colon_interval=self.colon_blink_interval)
+        else:
             self.display.show_dashes()
 
     def _update_display(self, status):
@@ -178,68 +282,175 @@ class PlayerService:
             self.display.show_volume(current_volume)
             return
         
-        elapsed_time = status.get('elapsed', '0')
-        total_time = status.get('duration', '0')
-        
         if state == 'play':
-            current_song = self.mpd.get_current_song()
-            self._check_track_change(current_song)
+            self._check_track_change(self.current_song)
             
             if current_time >= self.track_display_until:
-                self._update_time_display(elapsed_time, total_time)
+                self._update_time_display()
             
         elif state == 'pause':
-            self._update_pause_display(elapsed_time, total_time)
+            self._update_pause_display()
         elif state == 'stop':
             if not hasattr(self, '_last_state') or self._last_state != 'stop':
                 self.stop_display_state = 0
                 self.stop_state_changed_at = current_time
-            self._update_stop_display()
+            self._update_stop_display(status)
         
         self._last_state = state
 
     def show_volume(self, status):
         try:
             current_volume = int(status.get('volume', '0'))
-            log.debug(f"Displaying volume: {current_volume}")
+            log.debug("Displaying volume: %d", current_volume)
             self.display.show_volume(current_volume)
-            self.volume_display_until = time.time() + self.config.get('timing.volume_display_duration', 3)
+            self.volume_display_until = time.time() + self.volume_display_duration
         except (ValueError, TypeError):
             return
 
-    def _check_config_updates(self):
-        current_time = time.time()
-        update_config = self.config.get('updates.trigger', {})
-        check_interval = update_config.get('check_interval', 1)
-        trigger_file = update_config.get('file', '.update_trigger')
-        debounce_time = update_config.get('debounce_time', 0.1)
+    def _apply_config_updates(self):
+        snapshot = self.config_watcher.take_snapshot()
+        if snapshot is not None:
+            log.info("Processing configuration update")
+            self.config.apply(snapshot)
+
+        if self.config.generation == self._config_generation:
+            return
         
-        if (current_time - self.last_config_check) >= check_interval:
-            trigger_path = os.path.join(PROJECT_ROOT, 'config', trigger_file)
-            if os.path.exists(trigger_path):
-                log.debug("Configuration update triggered")
-                
-                time.sleep(debounce_time)
-                
-                self.config.load_config()
-                
-                new_brightness = self.config.get('display.brightness')
-                new_display_mode = self.config.get('display.mode')
-                
-                if new_brightness != self.display._brightness:
-                    log.debug("Updating brightness")
-                    self.display.update_brightness()
-                    self.led_controller._setup_leds()
-                
-                if new_display_mode != self.display_mode:
-                    log.debug("Updating display mode")
-                    self.display_mode = new_display_mode
-                    status = self.mpd.get_status()
-                    if status:
-                        self._update_display(status)
-                
-                os.unlink(trigger_path)
-            self.last_config_check = current_time
+        new_brightness = self.config.get('display.brightness')
+        new_display_mode = self.config.get('display.mode', DISPLAY_MODES['ELAPSED'])
+        
+        if new_brightness != self.display.brightness:
+            log.debug("Updating brightness")
+            self.display.update_brightness()
+            self.led_controller._setup_leds()
+        
+        self._load_display_config()
+        
+        if new_display_mode != self.display_mode:
+            log.debug("Updating display mode")
+            self.display_mode = new_display_mode
+            self._render()
+
+    def _wait_for_changes(self, timeout):
+        self._wakeup.wait(timeout)
+        self._wakeup.clear()
+        if not self.idle_watcher or not self.idle_watcher.connected:
+            return None
+        return self.idle_watcher.take_changes()
+
+    def _needs_refresh(self, changes):
+        if changes is None or changes or self.status is None:
+            return True
+        return (time.monotonic() - self.status_time) >= self.resync_interval
+
+    def _refresh_status(self):
+        status, song = self.mpd.get_snapshot()
+        self.status = status
+        self.current_song = song
+        self.status_time = time.monotonic()
+        if not status:
+            return
+
+        self.clock.sync(status)
+
+        self.led_controller.update_from_mpd_status(status)
+
+        current_volume = status.get('volume', '0')
+        if current_volume != self.last_volume:
+            self.show_volume(status)
+            self.last_volume = current_volume
+
+    def _handle_copy(self, files=None, queue=False, mirror=False):
+        if not queue and not files:
+            song = self.current_song
+            if not song or 'file' not in song:
+                raise Exception("No track currently playing")
+            files = [song['file']]
+        job, position = self.copy_queue.submit(None if queue else files, mirror)
+        return {'job': job.job_id, 'position': position}
+
+    def _call_soon(self, fn, *args):
+        from concurrent import futures
+        future = futures.Future()
+        self._commands.append((future, fn, args))
+        self._wakeup.set()
+        return future
+
+    def _call_in_loop(self, fn, *args):
+        from concurrent import futures
+        future = self._call_soon(fn, *args)
+        try:
+            return future.result(timeout=COMMAND_TIMEOUT)
+        except futures.TimeoutError:
+            future.cancel()
+            raise Exception("Player service did not respond in time")
+
+    def _run_commands(self):
+        executed = False
+        while self._commands:
+            future, fn, args = self._commands.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            executed = True
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                log.error(f"Command failed: {e}")
+                future.set_exception(e)
+        return executed
+
+    def _start_roulette(self, mode=None):
+        actions.start_roulette(self.mpd, mode or self.config.get('control.roulette', 'tracks'))
+
+    def _on_short_press(self):
+        self._call_soon(self._start_roulette)
+
+    def _on_long_press(self):
+        self._call_soon(actions.shutdown, self.mpd)
+
+    def _handle_option(self, option):
+        enabled = self._call_in_loop(actions.toggle_option, self.mpd, option)
+        return {'option': option, 'state': 'on' if enabled else 'off'}
+
+    def _handle_brightness(self):
+        return {'brightness': self._call_in_loop(actions.cycle_brightness, self.config)}
+
+    def _handle_display_mode(self):
+        return {'mode': self._call_in_loop(actions.toggle_display_mode, self.config)}
+
+    def _handle_roulette(self, mode=None):
+        self._call_in_loop(self._start_roulette, mode)
+        return {}
+
+    def _handle_shutdown(self):
+        self._call_soon(actions.shutdown, self.mpd)
+        return {}
+
+    def _render(self):
+        if self.copy_queue.busy:
+            return
+        if self.status:
+            self._update_display(self.status)
+            if self._started is not None:
+                log.ok(f"First frame after {self._elapsed_ms():.0f} ms")
+                self._started = None
+
+    def _next_tick_delay(self, polling):
+        current_time = time.time()
+        if polling and current_time < self.volume_display_until:
+            return self.volume_update_interval
+
+        delay = self.default_update_interval
+        state = self.status.get('state') if self.status else None
+        if state == 'play':
+            delay = self.clock.time_to_next_second(self._showing_remaining())
+            if polling:
+                delay = min(delay, self.default_update_interval)
+
+        for until in (self.volume_display_until, self.track_display_until):
+            if until > current_time:
+                delay = min(delay, until - current_time)
+        return delay
 
     def start(self):
         log.info("Starting player service")
@@ -252,39 +463,46 @@ class PlayerService:
         
         signal.signal(signal.SIGTERM, handle_signal)
         signal.signal(signal.SIGINT, handle_signal)
+        log.install_dump_signal(signal.SIGUSR1)
+
+        if self.idle_watcher:
+            log.info("Subscribing to MPD idle events")
+            self.idle_watcher.start()
+        self.config_watcher.start()
+        self.mount_watcher.start()
+        self.copy_queue.start()
+        self.control.start()
 
         try:
+            changes = None
             while self.running:
-                start_time = time.time()
-                
-                self._check_config_updates()
+                ready = self._mpd_ready()
+                if ready and self._run_commands():
+                    changes = None
+                self._apply_config_updates()
                 
-                status = self.mpd.get_status()
-                if status:
-                    self.led_controller.update_from_mpd_status(status)
-                    
-                    current_volume = status.get('volume', '0')
-                    if current_volume != self.last_volume:
-                        self.show_volume(status)
-                        self.last_volume = current_volume
-                    
-                    self._update_display(status)
+                if ready and self._needs_refresh(changes):
+                    self._refresh_status()
                 
-                current_time = time.time()
-                update_interval = (self.volume_update_interval 
-                                 if current_time < self.volume_display_until 
-                                 else self.default_update_interval)
+                self._render()
+                if time.monotonic() - self._state_saved_at >= self.state_save_interval:
+                    self._save_state()
                 
-                elapsed = time.time() - start_time
-                sleep_time = max(0, update_interval - elapsed)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                polling = not self.idle_watcher or not self.idle_watcher.connected
+                changes = self._wait_for_changes(self._next_tick_delay(polling))
 
         finally:
             self.cleanup()
 
     def cleanup(self):
         log.info("Shutting down player service")
+        self._save_state()
+        if self.idle_watcher:
+            self.idle_watcher.stop()
+        self.config_watcher.stop()
+        self.control.stop()
+        self.copy_queue.stop()
+        self.mount_watcher.stop()
         self.led_controller.cleanup()
         self.display.cleanup()
         self.button_controller.cleanup()
@@ -0,0 +1,63 @@
+import json
+import os
+import time
+from src.utils.logger import Logger
+
+log = Logger()
+
+DEFAULT_PATH = '/run/adam/state.json'
+STATE_VERSION = 1
+
+def encode_scene(scene):
+    if scene is None:
+        return None
+    return {'frame': scene.frame.hex(), 'alt_frame': scene.alt_frame.hex(), 'interval': scene.interval}
+
+def decode_scene(data):
+    try:
+        frame = bytes.fromhex(data['frame'])
+        alt_frame = bytes.fromhex(data['alt_frame'])
+        interval = float(data['interval'])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if len(frame) != 4 or len(alt_frame) != 4 or interval < 0:
+        return None
+    return frame, alt_frame, interval
+
+class StateStore:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable state file {self.path}: {e}")
+            return None
+        if not isinstance(state, dict) or state.get('version') != STATE_VERSION:
+            log.warning(f"Ignoring state file {self.path}: unsupported format")
+            return None
+        return state
+
+    def save(self, state):
+        state = dict(state, version=STATE_VERSION, saved_at=time.time())
+        temp_path = self.path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), mode=0o750, exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump(state, f, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            log.warning(f"Unable to save state to {self.path}: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def age(state):
+        saved_at = state.get('saved_at')
+        if not isinstance(saved_at, (int, float)):
+            return float('inf')
+        return time.time() - saved_at
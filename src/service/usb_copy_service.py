@@ -1,94 +1,220 @@
 import os
 import time
-from gpiozero import LED
 from src.core.config import Config
 from src.core.mpd_client import MPDClient
-from src.utils.storage import find_usb_drive, copy_directory
+from src.service.album_paths import album_paths
+from src.service.copy_planner import CopyPlanner, unique_albums
+from src.utils.storage import find_usb_drive, find_usb_drives, copy_directories, mirror_directory
 from src.utils.logger import Logger
 
 log = Logger()
 
+LED_PROGRESS_STEP = 5
+LOG_PROGRESS_STEP = 10
+
 class USBCopyService:
-    def __init__(self):
+    def __init__(self, display=None, mount_watcher=None):
         log.debug("Initializing USB copy service")
         self.config = Config()
         self.mpd = MPDClient()
+        self.display = display
+        self.mount_watcher = mount_watcher
+        self._led_step = None
+        self._log_step = None
+        self._mirror_progress = {}
         
         copy_config = self.config.get('copy', {})
         self.min_usb_size = copy_config.get('min_usb_size_gb', 4)
         self.path_structure = copy_config.get('path_structure', {})
         self.destination_skip_folders = copy_config.get('destination_skip_folders', [])
+        self.buffer_size = copy_config.get('buffer_size_kb', 1024) * 1024
+        self.incremental = copy_config.get('incremental', True)
+        self.verify = copy_config.get('verify', False)
         
         copy_led_pin = copy_config.get('led')
         if not copy_led_pin:
             log.warning("Copy LED pin not configured")
-        self.copy_led = LED(copy_led_pin) if copy_led_pin else None
-        if self.copy_led:
+        self.copy_led = None
+        if copy_led_pin:
+            from gpiozero import LED
+            self.copy_led = LED(copy_led_pin)
             self.copy_led.off()
             log.debug(f"Copy LED initialized on GPIO {copy_led_pin}")
 
-    def copy_current_track(self):
+    def _on_progress(self, progress):
+        percent = progress.percent
+        rate = progress.rate / 1024 / 1024
+        if self.display:
+            self.display.show_progress(percent, rate)
+
+        led_step = percent // LED_PROGRESS_STEP
+        if self.copy_led and led_step != self._led_step:
+            self._led_step = led_step
+            duty = min(0.95, max(0.05, percent / 100))
+            self.copy_led.blink(on_time=duty, off_time=1 - duty)
+
+        log_step = percent // LOG_PROGRESS_STEP
+        if log_step != self._log_step:
+            self._log_step = log_step
+            log.info(f"Progress: {percent}% of {progress.total_bytes/1024/1024:.1f} MB ({rate:.1f} MB/s)")
+
+    def _signal_error(self):
+        if self.copy_led:
+            log.debug("Error indication: blinking copy LED")
+            for _ in range(3):
+                self.copy_led.on()
+                time.sleep(0.2)
+                self.copy_led.off()
+                time.sleep(0.2)
+
+    def _connect_mpd(self):
+        log.wait("Attempting to connect to MPD...")
+        self.mpd.connect()
+        log.ok("Connected to MPD at localhost:6600")
+
+    def copy_current_track(self, mirror=False):
         try:
-            log.wait("Attempting to connect to MPD...")
-            self.mpd.connect()
-            log.ok("Connected to MPD at localhost:6600")
-            
+            self._connect_mpd()
             song = self.mpd.get_current_song()
             if not song or 'file' not in song:
                 raise Exception("No track currently playing")
-            
+        except Exception:
+            self._signal_error()
+            raise
+        self.copy_track(song['file'], mirror)
+
+    def copy_queue(self, mirror=False):
+        try:
+            self._connect_mpd()
+            playlist = self.mpd.get_playlist_info()['tracks']
+            files = [song['file'] for song in playlist if 'file' in song]
+            if not files:
+                raise Exception("Queue is empty")
+        except Exception:
+            self._signal_error()
+            raise
+        self.copy_albums(files, mirror)
+
+    def copy_track(self, file_path, mirror=False):
+        self.copy_albums([file_path], mirror)
+
+    def album_paths(self, file_path):
+        return album_paths(file_path, self.path_structure, self.destination_skip_folders)
+
+    def _resolve_albums(self, files):
+        log.info("=== PATH VALIDATION ===")
+        albums = []
+        for file_path in files:
+            paths = self.album_paths(file_path)
+            if paths is None:
+                log.warning(f"Invalid directory structure: {file_path}")
+                continue
+            albums.append(paths)
+        if not albums:
+            log.error("Invalid directory structure")
+            raise Exception("Invalid directory structure")
+        return albums
+
+    def _copy_planned(self, usb_info, albums):
+        log.info("=== COPY PLAN ===")
+        targets = [(source_dir, os.path.join(usb_info, preserved_path))
+                   for source_dir, preserved_path in albums]
+        plan = CopyPlanner(usb_info, self.incremental, self.verify).plan(targets)
+        if not plan.selected:
+            log.error("USB drive is full")
+            raise Exception("USB drive is full")
+
+        log.wait("Starting copy process...")
+        self._led_step = None
+        self._log_step = None
+        files_copied, total_size = copy_directories(
+            plan.selected, self.buffer_size,
+            on_progress=self._on_progress, verify=self.verify
+        )
+        log.ok("Copy process completed")
+        
+        log.info("=== COPY COMPLETE ===")
+        log.info(f"Files copied: {files_copied}")
+        log.info(f"Total size: {total_size/1024/1024:.2f} MB")
+        for album in plan.selected:
+            log.info(f"Album path: {os.path.relpath(album.destination, usb_info)}")
+        if plan.skipped:
+            log.warning(f"{len(plan.skipped)} albums did not fit on the USB drive")
+
+    def _on_mirror_progress(self, destination, progress):
+        self._mirror_progress[destination] = progress
+        self._on_progress(min(self._mirror_progress.values(), key=lambda p: p.percent))
+
+    def _mirror(self, usb_roots, albums):
+        log.info(f"=== MIRROR TO {len(usb_roots)} USB DRIVES ===")
+        albums = list(unique_albums(albums))
+        plans = {}
+        for root in usb_roots:
+            log.info(f"=== COPY PLAN: {root} ===")
+            targets = [(source_dir, os.path.join(root, preserved_path))
+                       for source_dir, preserved_path in albums]
+            plan = CopyPlanner(root, self.incremental, self.verify).plan(targets)
+            plans[root] = {album.source: album for album in plan.selected}
+            if plan.skipped:
+                log.warning(f"{root}: {len(plan.skipped)} albums did not fit on the USB drive")
+        if not any(plans.values()):
+            log.error("USB drive is full")
+            raise Exception("USB drive is full")
+
+        failed = {}
+        copied = dict.fromkeys(usb_roots, 0)
+        for source_dir, preserved_path in albums:
+            if len(failed) == len(usb_roots):
+                break
+            live = [root for root in usb_roots if root not in failed and source_dir in plans[root]]
+            if not live:
+                continue
+            self._led_step = None
+            self._log_step = None
+            self._mirror_progress = {}
+            results = mirror_directory(
+                [plans[root][source_dir] for root in live], self.buffer_size,
+                on_progress=self._on_mirror_progress, verify=self.verify
+            )
+            for root in live:
+                error = results[plans[root][source_dir].destination].error
+                if error is not None:
+                    failed[root] = error
+                else:
+                    copied[root] += 1
+            log.info(f"Album path: {preserved_path}")
+
+        log.info("=== MIRROR COMPLETE ===")
+        for root in usb_roots:
+            if root in failed:
+                log.error(f"{root}: failed ({failed[root]})")
+            else:
+                log.ok(f"{root}: {copied[root]} albums copied")
+        if len(failed) == len(usb_roots):
+            raise Exception("Mirror failed on every USB drive")
+
+    def copy_albums(self, files, mirror=False):
+        try:
             log.info("=== USB DRIVE DETECTION ===")
-            usb_info = find_usb_drive(self.min_usb_size)
-            if not usb_info:
-                raise Exception("No suitable USB drive found")
+            if mirror:
+                usb_roots = find_usb_drives(self.min_usb_size, self.mount_watcher)
+                if not usb_roots:
+                    raise Exception("No suitable USB drive found")
+                log.ok(f"{len(usb_roots)} USB devices found")
+            else:
+                usb_info = find_usb_drive(self.min_usb_size, self.mount_watcher)
+                if not usb_info:
+                    raise Exception("No suitable USB drive found")
             
             if self.copy_led:
                 self.copy_led.on()
                 log.debug("Copy LED turned on - starting copy process")
             
-            log.info("=== PATH ANALYSIS ===")
-            file_path = song['file']
-            current_file = os.path.basename(file_path)
-            log.debug(f"Current file: {current_file}")
-            log.debug(f"File path: {file_path}")
-            
-            log.info("=== PATH VALIDATION ===")
-            path_parts = file_path.split('/')
-            if len(path_parts) >= self.path_structure['min_depth']:
-                source_dir = os.path.join(
-                    self.path_structure['music_root'],
-                    os.path.dirname(file_path)
-                )
-                log.debug(f"Source directory: {source_dir}")
-                
-                dest_parts = path_parts.copy()
-                log.debug(f"Original path parts: {dest_parts}")
-                
-                dest_parts = [part for part in dest_parts if part not in self.destination_skip_folders]
-                log.debug(f"After skip folders: {dest_parts}")
-                
-                if len(dest_parts) >= 2:
-                    artist = dest_parts[0]
-                    album = dest_parts[1]
-                    
-                    preserved_path = os.path.join(artist, album)
-                    log.debug(f"Preserved path: {preserved_path}")
-                    
-                    dest_dir = os.path.join(usb_info, preserved_path)
-                    log.debug(f"Destination directory: {dest_dir}")
-                    
-                    log.wait("Starting copy process...")
-                    files_copied, total_size = copy_directory(source_dir, dest_dir)
-                    log.ok("Copy process completed")
-                    
-                    log.info("=== COPY COMPLETE ===")
-                    log.info(f"Files copied: {files_copied}")
-                    log.info(f"Total size: {total_size/1024/1024:.2f} MB")
-                    log.info(f"Album path: {preserved_path}")
-                
+            albums = self._resolve_albums(files)
+            if mirror:
+                self._mirror(usb_roots, albums)
             else:
-                log.error("Invalid directory structure")
-                raise Exception("Invalid directory structure")
+                self._copy_planned(usb_info, albums)
             
         except OSError as e:
             if e.errno == 28:
@@ -97,17 +223,10 @@ class USBCopyService:
             raise
             
         except Exception as e:
-            if self.copy_led:
-                log.debug("Error indication: blinking copy LED")
-                for _ in range(3):
-                    self.copy_led.on()
-                    time.sleep(0.2)
-                    self.copy_led.off()
-                    time.sleep(0.2)
+            self._signal_error()
             raise e
         
         finally:
             if self.copy_led:
                 self.copy_led.off()
                 log.debug("Copy LED turned off")
-
@@ -1,7 +1,14 @@
-from .storage import find_usb_drive, copy_directory
+from .lazy import lazy_exports
 from .logger import Logger
 
 log = Logger()
 log.debug("Initializing utility modules")
 
-__all__ = ["find_usb_drive", "copy_directory", "Logger"] 
+_EXPORTS = {
+    "find_usb_drive": ".storage",
+    "copy_directory": ".storage",
+    "MountWatcher": ".mounts"
+}
+
+__all__ = list(_EXPORTS) + ["Logger"]
+__getattr__ = lazy_exports(globals(), _EXPORTS)
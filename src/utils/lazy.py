@@ -0,0 +1,14 @@
+from importlib import import_module
+
+def lazy_exports(namespace, exports):
+    package = namespace['__name__']
+
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
@@ -1,3 +1,13 @@
+import atexit
+import queue
+import signal
+import sys
+import threading
+import time
+from collections import deque
+
+_STOP = object()
+
 class Logger:
     LEVELS = {
         "DEBUG": 10,
@@ -9,6 +19,15 @@ class Logger:
         "OK": 22
     }
 
+    METHODS = {
+        "DEBUG": "debug",
+        "INFO": "info",
+        "WAIT": "wait",
+        "OK": "ok",
+        "WARNING": "warning",
+        "ERROR": "error"
+    }
+
     _instance = None
 
     def __new__(cls):
@@ -22,25 +41,215 @@ class Logger:
             self.enabled = True
             self.level = "INFO"
             self.format = "[{level}] {message}"
+            self.dropped = 0
+            self._reported_drops = 0
+            self._queue = None
+            self._writer = None
+            self._ring = None
+            self._dump_requested = False
+            self._suppress = {}
+            self._recent = {}
+            self._suppress_lock = threading.Lock()
+            self._bind_levels()
+            atexit.register(self.flush)
             self.initialized = True
 
     def configure(self, settings):
         self.enabled = settings.get('logging', {}).get('enable', True)
         self.level = settings.get('logging', {}).get('level', 'INFO').upper()
         self.format = settings.get('logging', {}).get('format', '[{level}] {message}')
+        self._configure_ring(settings.get('logging', {}).get('ring_size', 0))
+        self._configure_writer(settings.get('logging', {}).get('queue_size', 0))
+        self._configure_suppression(settings.get('logging', {}).get('suppress', {}))
+        self._bind_levels()
+
+    def _configure_suppression(self, windows):
+        with self._suppress_lock:
+            self._suppress = {
+                level.upper(): float(window)
+                for level, window in windows.items() if window
+            }
+            self._recent = {}
+
+    def _configure_ring(self, size):
+        if not size:
+            self._ring = None
+        elif self._ring is None or self._ring.maxlen != size:
+            self._ring = deque(self._ring or (), maxlen=size)
+
+    def _configure_writer(self, size):
+        if not size or self._writer is not None:
+            return
+        self._queue = queue.Queue(maxsize=size)
+        self._writer = threading.Thread(target=self._writer_loop, name="log-writer", daemon=True)
+        self._writer.start()
+
+    def _bind_levels(self):
+        if self.level not in self.LEVELS:
+            self.level = "INFO"
+        threshold = self.LEVELS[self.level]
+        self.debug_enabled = self.enabled and threshold <= self.LEVELS["DEBUG"]
+        for level, method in self.METHODS.items():
+            if not self.enabled or threshold > self.LEVELS[level]:
+                setattr(self, method, self._discard)
+            else:
+                self.__dict__.pop(method, None)
+        if not self.debug_enabled and self._ring is not None:
+            self.debug = self._record_debug
+
+    def is_enabled_for(self, level):
+        return self.enabled and self.LEVELS[self.level] <= self.LEVELS[level]
+
+    @staticmethod
+    def _discard(message, *args):
+        pass
+
+    def _record_debug(self, message, *args):
+        self._ring.append((time.time(), message, args))
+
+    @staticmethod
+    def _render(message, args):
+        if args:
+            try:
+                return message % args
+            except (TypeError, ValueError):
+                return f"{message} {args!r}"
+        if callable(message):
+            return message()
+        return message
 
-    def _log(self, level, message):
-        if not self.enabled or self.LEVELS[self.level] > self.LEVELS[level]:
+    def _log(self, level, message, *args):
+        if not self.is_enabled_for(level):
             return
-            
-        print(self.format.format(
+
+        if level == "DEBUG" and self._ring is not None:
+            self._ring.append((time.time(), message, args))
+
+        message = self._render(message, args)
+        window = self._suppress.get(level)
+        if window and self._is_repeat(level, message, window):
+            return
+        if self._queue is None:
+            self._sweep_repeats()
+
+        self._write(self.format.format(
             level=level,
             message=message
         ))
 
-    def debug(self, message): self._log("DEBUG", message)
-    def info(self, message): self._log("INFO", message)
-    def wait(self, message): self._log("WAIT", message)
-    def ok(self, message): self._log("OK", message)
-    def warning(self, message): self._log("WARNING", message)
-    def error(self, message): self._log("ERROR", message) 
\ No newline at end of file
+    def _is_repeat(self, level, message, window):
+        now = time.monotonic()
+        with self._suppress_lock:
+            self._flush_repeats(now)
+            entry = self._recent.get((level, message))
+            if entry is not None:
+                entry[1] += 1
+                return True
+            self._recent[(level, message)] = [now + window, 0]
+            return False
+
+    def _flush_repeats(self, now, force=False):
+        for key, (expires, count) in list(self._recent.items()):
+            if expires > now and not force:
+                continue
+            del self._recent[key]
+            if count:
+                level, message = key
+                self._write(self.format.format(
+                    level=level,
+                    message=f"{message} (repeated {count} times)"
+                ))
+
+    def _sweep_repeats(self, force=False):
+        if not self._recent:
+            return
+        with self._suppress_lock:
+            self._flush_repeats(time.monotonic(), force)
+
+    def _write(self, line):
+        if self._queue is None:
+            print(line)
+            return
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def _writer_loop(self):
+        while True:
+            try:
+                line = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                line = None
+
+            if self._dump_requested:
+                self._dump_requested = False
+                self._dump_ring()
+
+            if line is None:
+                self._sweep_repeats()
+
+            if self.dropped != self._reported_drops:
+                dropped = self.dropped - self._reported_drops
+                self._reported_drops = self.dropped
+                sys.stdout.write(self.format.format(
+                    level="WARNING",
+                    message=f"Log queue full, dropped {dropped} records"
+                ) + "\n")
+
+            if line is _STOP:
+                sys.stdout.flush()
+                return
+            if line is not None:
+                sys.stdout.write(line + "\n")
+            if self._queue.empty():
+                sys.stdout.flush()
+
+    def _dump_ring(self):
+        records = list(self._ring or ())
+        lines = [self.format.format(
+            level="INFO",
+            message=f"Dumping {len(records)} recent debug records"
+        )]
+        for timestamp, message, args in records:
+            try:
+                message = self._render(message, args)
+            except Exception as e:
+                message = f"{message!r} (format failed: {e})"
+            clock = time.strftime('%H:%M:%S', time.localtime(timestamp))
+            lines.append(self.format.format(
+                level="DEBUG",
+                message=f"{clock}.{int(timestamp % 1 * 1000):03d} {message}"
+            ))
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def request_dump(self):
+        if self._writer is not None:
+            self._dump_requested = True
+        else:
+            self._dump_ring()
+
+    def install_dump_signal(self, signum):
+        signal.signal(signum, lambda signum, frame: self.request_dump())
+
+    def flush(self):
+        self._sweep_repeats(force=True)
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            sys.stdout.flush()
+            return
+        try:
+            self._queue.put(_STOP, timeout=1)
+        except queue.Full:
+            return
+        writer.join(timeout=2)
+        self._writer = None
+        self._queue = None
+
+    def debug(self, message, *args): self._log("DEBUG", message, *args)
+    def info(self, message, *args): self._log("INFO", message, *args)
+    def wait(self, message, *args): self._log("WAIT", message, *args)
+    def ok(self, message, *args): self._log("OK", message, *args)
+    def warning(self, message, *args): self._log("WARNING", message, *args)
+    def error(self, message, *args): self._log("ERROR", message, *args)
@@ -0,0 +1,135 @@
+import os
+import select
+import threading
+from collections import namedtuple
+from src.utils.logger import Logger
+
+log = Logger()
+
+MOUNTINFO_PATH = '/proc/self/mountinfo'
+USB_DEVICE_PREFIX = '/dev/sd'
+USB_FILESYSTEMS = ('vfat', 'exfat', 'ntfs', 'ntfs3', 'fuseblk', 'ext4')
+
+MountEntry = namedtuple('MountEntry', ['mount_id', 'device', 'mountpoint', 'fstype'])
+UsbMount = namedtuple('UsbMount', ['device', 'mountpoint', 'fstype', 'total', 'free'])
+
+def _unescape(field):
+    return field.replace('\\040', ' ').replace('\\011', '\t').replace('\\012', '\n').replace('\\134', '\\')
+
+def parse_mountinfo(content):
+    entries = []
+    for line in content.splitlines():
+        fields = line.split()
+        try:
+            separator = fields.index('-')
+            entries.append(MountEntry(
+                fields[0],
+                _unescape(fields[separator + 2]),
+                _unescape(fields[4]),
+                fields[separator + 1]
+            ))
+        except (ValueError, IndexError):
+            continue
+    return entries
+
+def is_usb_candidate(entry):
+    return entry.device.startswith(USB_DEVICE_PREFIX) and entry.fstype in USB_FILESYSTEMS
+
+def probe_usb_mount(entry):
+    try:
+        usage = os.statvfs(entry.mountpoint)
+    except OSError as e:
+        log.debug(f"Could not check drive size: {str(e)}")
+        return None
+    total = usage.f_blocks * usage.f_frsize
+    free = usage.f_bavail * usage.f_frsize
+    log.debug(f"Device {entry.device}: {total/1024**3:.1f} GB ({free/1024**3:.1f} GB free)")
+    return UsbMount(entry.device, entry.mountpoint, entry.fstype, total, free)
+
+def scan_usb_mounts(known=None):
+    with open(MOUNTINFO_PATH, 'r') as f:
+        entries = parse_mountinfo(f.read())
+    known = known or {}
+    mounts = {}
+    for entry in entries:
+        if not is_usb_candidate(entry):
+            continue
+        if entry in known:
+            mounts[entry] = known[entry]
+            continue
+        mount = probe_usb_mount(entry)
+        if mount is not None:
+            mounts[entry] = mount
+    return mounts
+
+class MountWatcher:
+    def __init__(self, poll_interval=None):
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._mounts = {}
+        self._thread = None
+        self._file = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._refresh()
+        try:
+            self._file = open(MOUNTINFO_PATH, 'r')
+            self._file.read()
+        except OSError as e:
+            log.warning(f"Mount table unavailable ({e}), USB discovery falls back to scans")
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="mount-watch", daemon=True)
+        self._thread.start()
+        log.debug(f"Watching {MOUNTINFO_PATH} for USB mounts")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def usb_mounts(self, min_size_gb=0):
+        if not self.running:
+            self._refresh()
+        with self._lock:
+            mounts = list(self._mounts.values())
+        return [mount for mount in mounts if mount.total >= min_size_gb * 1024**3]
+
+    def _refresh(self):
+        with self._lock:
+            known = dict(self._mounts)
+        try:
+            mounts = scan_usb_mounts(known)
+        except OSError as e:
+            log.warning(f"Unable to read mount table: {e}")
+            return
+        with self._lock:
+            self._mounts = mounts
+        added = set(mounts) - set(known)
+        removed = set(known) - set(mounts)
+        for entry in added:
+            log.info(f"USB drive mounted: {entry.mountpoint}")
+        for entry in removed:
+            log.info(f"USB drive removed: {entry.mountpoint}")
+
+    def _run(self):
+        poller = select.poll()
+        poller.register(self._file, select.POLLPRI | select.POLLERR)
+        timeout = self.poll_interval * 1000 if self.poll_interval else 1000
+        while not self._stop_event.is_set():
+            if not poller.poll(timeout):
+                if self.poll_interval:
+                    self._refresh()
+                continue
+            self._file.seek(0)
+            self._file.read()
+            self._refresh()
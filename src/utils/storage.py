@@ -1,69 +1,685 @@
+import ctypes
+import errno
+import json
 import os
-import shutil
-import psutil
-import subprocess
-from typing import Tuple, Optional
+import queue
+import stat
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
 from src.utils.logger import Logger
+from src.utils.mounts import MountWatcher
 
 log = Logger()
 
-def find_usb_drive(min_size_gb: int = 4) -> Optional[str]:
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+POSIX_FILESYSTEMS = ('ext2', 'ext3', 'ext4', 'xfs', 'btrfs', 'f2fs')
+_FALLBACK_ERRNOS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF)
+MANIFEST_NAME = '.adam_manifest.json'
+PARTIAL_SUFFIX = '.adam-part'
+MTIME_TOLERANCE_NS = 2 * 10**9
+RESUME_MARGIN = 1024 * 1024
+RANGE_CHUNK_SIZE = 8 * 1024 * 1024
+PROGRESS_INTERVAL = 0.5
+HASH_ALGORITHM = 'sha256'
+HASH_BUFFERS = 2
+MIRROR_BUFFERS = 8
+
+DirectoryPlan = namedtuple('DirectoryPlan', ['source', 'destination', 'pending', 'manifest',
+                                             'incremental', 'files_skipped'])
+
+MirrorResult = namedtuple('MirrorResult', ['files_copied', 'total_size', 'error'])
+
+class VerificationError(Exception):
+    def __init__(self, files: List[str]):
+        super().__init__(f"Verification failed for {len(files)} files: {', '.join(files)}")
+        self.files = files
+
+def find_usb_drives(min_size_gb: int = 4, watcher: Optional[MountWatcher] = None) -> List[str]:
+    mounts = (watcher or MountWatcher()).usb_mounts(min_size_gb)
+    for mount in mounts:
+        log.debug(f"Device found: {mount.mountpoint} {mount.total/1024**3:.1f} GB "
+                  f"({mount.free/1024**3:.1f} GB free)")
+    return sorted(mount.mountpoint for mount in mounts)
+
+def find_usb_drive(min_size_gb: int = 4, watcher: Optional[MountWatcher] = None) -> Optional[str]:
     log.info("Looking for USB device...")
-    partitions = psutil.disk_partitions(all=True)
-    for partition in partitions:
-        if is_valid_usb(partition):
-            log.ok("USB device found")
-            return partition.mountpoint
+    mounts = find_usb_drives(min_size_gb, watcher)
+    if mounts:
+        log.ok("USB device found")
+        return mounts[0]
     log.info("No USB device connected")
     return None
 
-def copy_directory(source: str, destination: str) -> Tuple[int, int]:
+def filesystem_type(path: str) -> Optional[str]:
+    path = os.path.realpath(path)
+    best_mount, best_type = '', None
+    try:
+        with open('/proc/self/mounts', 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mountpoint = fields[1].replace('\\040', ' ')
+                if (path == mountpoint or path.startswith(mountpoint.rstrip('/') + '/')) \
+                        and len(mountpoint) >= len(best_mount):
+                    best_mount, best_type = mountpoint, fields[2]
+    except OSError:
+        return None
+    return best_type
+
+class CopyProgress:
+    def __init__(self, total_bytes: int, total_files: int,
+                 callback: Optional[Callable] = None, interval: float = PROGRESS_INTERVAL):
+        self.total_bytes = total_bytes
+        self.total_files = total_files
+        self.bytes_done = 0
+        self.files_done = 0
+        self.callback = callback
+        self.interval = interval
+        self.started = time.monotonic()
+        self._next_event = self.started
+
+    @property
+    def percent(self) -> int:
+        if not self.total_bytes:
+            return 100
+        return min(100, self.bytes_done * 100 // self.total_bytes)
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.bytes_done / elapsed if elapsed > 0 else 0.0
+
+    def advance(self, nbytes: int) -> None:
+        self.bytes_done += nbytes
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if now >= self._next_event:
+            self._next_event = now + self.interval
+            self.callback(self)
+
+    def file_done(self) -> None:
+        self.files_done += 1
+
+    def finish(self) -> None:
+        if self.callback is not None:
+            self.callback(self)
+
+class ChunkHasher:
+    def __init__(self, executor: ThreadPoolExecutor, algorithm: str = HASH_ALGORITHM):
+        import hashlib
+        self._hash = hashlib.new(algorithm)
+        self._executor = executor
+        self._pending = deque()
+
+    def submit(self, chunk, done: Optional[Callable] = None) -> None:
+        future = self._executor.submit(self._hash.update, chunk)
+        if done is not None:
+            future.add_done_callback(lambda _: done())
+        self._pending.append(future)
+
+    def wait(self, limit: int = 0) -> None:
+        while len(self._pending) > limit:
+            self._pending.popleft().result()
+
+    def hexdigest(self) -> str:
+        self.wait()
+        return self._hash.hexdigest()
+
+def _read_chunks(fd: int, buffer_size: int, hasher: ChunkHasher, end: Optional[int] = None):
+    buffers = [bytearray(buffer_size) for _ in range(HASH_BUFFERS)]
+    remaining = end
+    index = 0
+    while remaining is None or remaining > 0:
+        buffer = buffers[index]
+        index = (index + 1) % HASH_BUFFERS
+        hasher.wait(HASH_BUFFERS - 1)
+        if remaining is not None and remaining < buffer_size:
+            buffer = memoryview(buffer)[:remaining]
+        read = os.readv(fd, [buffer])
+        if not read:
+            break
+        chunk = memoryview(buffer)[:read]
+        hasher.submit(chunk)
+        if remaining is not None:
+            remaining -= read
+        yield chunk
+    hasher.wait()
+
+def _copy_hashed(src_fd: int, dst_fd: int, offset: int, buffer_size: int, hasher: ChunkHasher,
+                 progress: Optional[Callable] = None) -> int:
+    os.lseek(src_fd, 0, os.SEEK_SET)
+    for _ in _read_chunks(src_fd, buffer_size, hasher, offset):
+        pass
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    for chunk in _read_chunks(src_fd, buffer_size, hasher):
+        written = 0
+        while written < len(chunk):
+            written += os.write(dst_fd, chunk[written:])
+        offset += len(chunk)
+        if progress:
+            progress(len(chunk))
+    return offset
+
+def hash_file(path: str, executor: ThreadPoolExecutor, buffer_size: int = DEFAULT_BUFFER_SIZE,
+              drop_cache: bool = False) -> str:
+    hasher = ChunkHasher(executor)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if drop_cache and hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        for _ in _read_chunks(fd, buffer_size, hasher):
+            pass
+    finally:
+        os.close(fd)
+    return hasher.hexdigest()
+
+def _copy_range(src_fd: int, dst_fd: int, size: int, offset: int,
+                progress: Optional[Callable] = None) -> int:
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    while copy_file_range and offset < size:
+        try:
+            sent = copy_file_range(src_fd, dst_fd, min(size - offset, RANGE_CHUNK_SIZE), offset, offset)
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+            break
+        if sent == 0:
+            break
+        offset += sent
+        if progress:
+            progress(sent)
+
+    while offset < size:
+        try:
+            os.lseek(dst_fd, offset, os.SEEK_SET)
+            sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, RANGE_CHUNK_SIZE))
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+            break
+        if sent == 0:
+            break
+        offset += sent
+        if progress:
+            progress(sent)
+    return offset
+
+def _copy_buffered(src_fd: int, dst_fd: int, offset: int, buffer_size: int,
+                   progress: Optional[Callable] = None) -> int:
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    while True:
+        read = os.readv(src_fd, [buffer])
+        if not read:
+            return offset
+        written = 0
+        while written < read:
+            written += os.write(dst_fd, view[written:read])
+        offset += read
+        if progress:
+            progress(read)
+
+def copy_file(src: str, dst: str, buffer_size: int = DEFAULT_BUFFER_SIZE,
+              preserve_mode: bool = False, resume: bool = False,
+              progress: Optional[Callable] = None, hasher: Optional[ChunkHasher] = None) -> int:
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        src_stat = os.fstat(src_fd)
+        flags = os.O_WRONLY | os.O_CREAT | (0 if resume else os.O_TRUNC)
+        dst_fd = os.open(dst, flags, 0o644)
+        try:
+            offset = 0
+            if resume:
+                offset = min(os.fstat(dst_fd).st_size, src_stat.st_size)
+                offset = max(0, offset - RESUME_MARGIN)
+                os.ftruncate(dst_fd, offset)
+                if offset:
+                    log.debug("Resuming %s at %d bytes", os.path.basename(src), offset)
+                    if progress:
+                        progress(offset)
+            if hasher is not None:
+                offset = _copy_hashed(src_fd, dst_fd, offset, buffer_size, hasher, progress)
+            else:
+                offset = _copy_range(src_fd, dst_fd, src_stat.st_size, offset, progress)
+            if offset < src_stat.st_size:
+                offset = _copy_buffered(src_fd, dst_fd, offset, buffer_size, progress)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    if preserve_mode:
+        os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    return offset
+
+def _file_signature(file_stat) -> dict:
+    return {'size': file_stat.st_size, 'mtime_ns': file_stat.st_mtime_ns}
+
+def _matches_signature(entry: Optional[dict], file_stat) -> bool:
+    return bool(entry) and all(entry.get(key) == value for key, value in _file_signature(file_stat).items())
+
+def load_manifest(destination: str) -> dict:
+    try:
+        with open(os.path.join(destination, MANIFEST_NAME), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if not isinstance(manifest, dict):
+        manifest = {}
+    manifest.setdefault('files', {})
+    manifest.setdefault('partial', {})
+    return manifest
+
+def save_manifest(destination: str, manifest: dict) -> None:
+    path = os.path.join(destination, MANIFEST_NAME)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+def is_up_to_date(src_stat, dst_file: str, entry: Optional[dict]) -> bool:
+    try:
+        dst_stat = os.stat(dst_file)
+    except OSError:
+        return False
+    if dst_stat.st_size != src_stat.st_size:
+        return False
+    if _matches_signature(entry, src_stat):
+        return True
+    return abs(dst_stat.st_mtime_ns - src_stat.st_mtime_ns) <= MTIME_TOLERANCE_NS
+
+def _copy_incremental(src_file: str, dst_file: str, relative: str, src_stat, manifest: dict,
+                      destination: str, buffer_size: int, preserve_mode: bool,
+                      progress: Optional[Callable] = None,
+                      hasher: Optional[ChunkHasher] = None) -> int:
+    signature = _file_signature(src_stat)
+    partial_file = dst_file + PARTIAL_SUFFIX
+    resume = manifest['partial'].get(relative) == signature and os.path.exists(partial_file)
+
+    manifest['partial'][relative] = signature
+    save_manifest(destination, manifest)
+
+    size = copy_file(src_file, partial_file, buffer_size, preserve_mode, resume, progress, hasher)
+    os.replace(partial_file, dst_file)
+
+    del manifest['partial'][relative]
+    manifest['files'][relative] = signature
+    return size
+
+def sync_filesystem(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.syncfs(fd) == 0:
+            return
+        log.debug("syncfs failed (errno %d), falling back to sync", ctypes.get_errno())
+    except (OSError, AttributeError):
+        pass
+    finally:
+        os.close(fd)
+    os.sync()
+
+def scan_directory(source: str) -> List[Tuple[str, os.stat_result]]:
+    entries = []
+    pending = ['']
+    while pending:
+        relative_dir = pending.pop()
+        with os.scandir(os.path.join(source, relative_dir)) as it:
+            for entry in it:
+                relative = os.path.join(relative_dir, entry.name) if relative_dir else entry.name
+                if entry.is_dir():
+                    pending.append(relative)
+                elif entry.is_file():
+                    entries.append((relative, entry.stat()))
+    entries.sort()
+    return entries
+
+def plan_directory(source: str, destination: str, incremental: bool = False,
+                   verify: bool = False) -> DirectoryPlan:
     if not os.path.exists(source):
         log.error(f"Source directory not found: {source}")
         raise FileNotFoundError(f"Source directory not found: {source}")
-    total_files = sum([len(files) for _, _, files in os.walk(source)])
+    entries = scan_directory(source)
+    manifest = load_manifest(destination) if incremental or verify else None
+
+    pending = []
+    for relative, src_stat in entries:
+        entry = manifest['files'].get(relative) if manifest is not None else None
+        if incremental and is_up_to_date(src_stat, os.path.join(destination, relative), entry):
+            signature = _file_signature(src_stat)
+            if _matches_signature(entry, src_stat) and HASH_ALGORITHM in entry:
+                signature[HASH_ALGORITHM] = entry[HASH_ALGORITHM]
+            manifest['files'][relative] = signature
+            continue
+        pending.append((relative, src_stat))
+    return DirectoryPlan(source, destination, pending, manifest, incremental, len(entries) - len(pending))
+
+def plan_size(plan: DirectoryPlan, block_size: int = 1) -> int:
+    return sum(-(-src_stat.st_size // block_size) * block_size for _, src_stat in plan.pending)
+
+def _sync_destinations(plans: List[DirectoryPlan]) -> None:
+    synced = set()
+    for plan in plans:
+        device = os.stat(plan.destination).st_dev
+        if device not in synced:
+            synced.add(device)
+            sync_filesystem(plan.destination)
+
+def copy_directories(plans: List[DirectoryPlan], buffer_size: int = DEFAULT_BUFFER_SIZE,
+                     on_progress: Optional[Callable] = None, verify: bool = False) -> Tuple[int, int]:
+    progress = CopyProgress(sum(plan_size(plan) for plan in plans),
+                            sum(len(plan.pending) for plan in plans), on_progress)
     log.info("=== COPY ANALYSIS ===")
-    log.debug(f"Total files: {total_files}")
-    log.debug(f"Source: {source}")
-    log.debug(f"Destination: {destination}")
-    files_copied = 0
+    log.debug(f"Total files: {progress.total_files} ({progress.total_bytes/1024/1024:.1f} MB to copy)")
+    for plan in plans:
+        log.debug(f"Source: {plan.source}")
+        log.debug(f"Destination: {plan.destination}")
+
+    failed = []
     total_size = 0
-    for root, dirs, files in os.walk(source):
-        relative_path = os.path.relpath(root, source)
-        target_dir = os.path.join(destination) if relative_path == '.' else os.path.join(destination, relative_path)
-        os.makedirs(target_dir, exist_ok=True)
-        for file in files:
-            files_copied += 1
-            log.wait(f"Copying file {files_copied}/{total_files}")
-            src_file = os.path.join(root, file)
-            dst_file = os.path.join(target_dir, file)
-            file_size = os.path.getsize(src_file)
-            total_size += file_size
+    hash_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='copy-hash') if verify else None
+    try:
+        for plan in plans:
+            os.makedirs(plan.destination, exist_ok=True)
+            preserve_mode = filesystem_type(plan.destination) in POSIX_FILESYSTEMS
+            total_size += _copy_pending(plan, buffer_size, preserve_mode, progress, hash_pool)
+        progress.finish()
+
+        log.wait("Flushing data to destination...")
+        _sync_destinations(plans)
+        if verify and progress.files_done:
+            log.wait(f"Verifying {progress.files_done} copied files...")
+            for plan in plans:
+                failed.extend(_verify_copies(plan, buffer_size, hash_pool))
+    finally:
+        if hash_pool is not None:
+            hash_pool.shutdown()
+
+    saved = [plan for plan in plans if plan.manifest is not None]
+    for plan in saved:
+        save_manifest(plan.destination, plan.manifest)
+    if saved:
+        _sync_destinations(saved)
+    if failed:
+        log.error(f"Checksum mismatch on {len(failed)} files, removed from destination")
+        raise VerificationError(failed)
+    if verify and progress.files_done:
+        log.ok("All copied files verified")
+
+    files_skipped = sum(plan.files_skipped for plan in plans)
+    if files_skipped:
+        log.info(f"Skipped {files_skipped} files already on destination")
+    log.ok(f"Copy complete: {progress.files_done} files ({total_size/1024/1024:.1f} MB)")
+    return progress.files_done, total_size
+
+def copy_directory(source: str, destination: str, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                   incremental: bool = False, on_progress: Optional[Callable] = None,
+                   verify: bool = False) -> Tuple[int, int]:
+    plan = plan_directory(source, destination, incremental, verify)
+    return copy_directories([plan], buffer_size, on_progress, verify)
+
+def _copy_pending(plan: DirectoryPlan, buffer_size: int, preserve_mode: bool,
+                  progress: CopyProgress, hash_pool: Optional[ThreadPoolExecutor]) -> int:
+    source, destination, manifest = plan.source, plan.destination, plan.manifest
+    created_dirs = {destination}
+    total_size = 0
+    for relative, src_stat in plan.pending:
+        src_file = os.path.join(source, relative)
+        dst_file = os.path.join(destination, relative)
+        target_dir = os.path.dirname(dst_file)
+        if target_dir not in created_dirs:
+            os.makedirs(target_dir, exist_ok=True)
+            created_dirs.add(target_dir)
+        hasher = ChunkHasher(hash_pool) if hash_pool is not None else None
+        try:
+            if plan.incremental:
+                total_size += _copy_incremental(src_file, dst_file, relative, src_stat, manifest,
+                                                destination, buffer_size, preserve_mode,
+                                                progress.advance, hasher)
+            else:
+                total_size += copy_file(src_file, dst_file, buffer_size, preserve_mode,
+                                        progress=progress.advance, hasher=hasher)
+                if manifest is not None:
+                    manifest['files'][relative] = _file_signature(src_stat)
+        except Exception as e:
+            log.error(f"Unable to copy {relative}: {str(e)}")
+            raise
+        if hasher is not None:
+            manifest['files'][relative][HASH_ALGORITHM] = hasher.hexdigest()
+        progress.file_done()
+    return total_size
+
+def _verify_copies(plan: DirectoryPlan, buffer_size: int, hash_pool: ThreadPoolExecutor) -> List[str]:
+    manifest = plan.manifest
+    failed = []
+    for relative, _ in plan.pending:
+        dst_file = os.path.join(plan.destination, relative)
+        expected = manifest['files'][relative][HASH_ALGORITHM]
+        try:
+            matches = hash_file(dst_file, hash_pool, buffer_size, drop_cache=True) == expected
+        except OSError as e:
+            log.error(f"Unable to read back {relative}: {str(e)}")
+            matches = False
+        if matches:
+            continue
+        failed.append(dst_file)
+        del manifest['files'][relative]
+        try:
+            os.remove(dst_file)
+        except OSError:
+            pass
+    return failed
+
+class _MirrorChunk:
+    __slots__ = ('buffer', 'length', 'pending', 'pool', 'lock')
+
+    def __init__(self, buffer, length: int, pending: int, pool: queue.Queue):
+        self.buffer = buffer
+        self.length = length
+        self.pending = pending
+        self.pool = pool
+        self.lock = threading.Lock()
+
+    def release(self) -> None:
+        with self.lock:
+            self.pending -= 1
+            if self.pending:
+                return
+        self.pool.put(self.buffer)
+
+class _MirrorWriter:
+    def __init__(self, plan: DirectoryPlan, buffer_size: int, on_progress: Optional[Callable] = None,
+                 verify: bool = False):
+        self.plan = plan
+        self.destination = plan.destination
+        self.wanted = {relative for relative, _ in plan.pending}
+        self.buffer_size = buffer_size
+        self.verify = verify
+        self.queue = queue.Queue()
+        self.error = None
+        self.files_copied = 0
+        self.total_size = 0
+        callback = (lambda progress: on_progress(self.destination, progress)) if on_progress else None
+        self.progress = CopyProgress(plan_size(plan), len(plan.pending), callback)
+        self.preserve_mode = False
+        self._copied = []
+        self._fd = None
+        self._file = None
+        self._thread = threading.Thread(target=self._run, name="mirror-writer", daemon=True)
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def join(self) -> None:
+        self._thread.join()
+
+    def _open(self, relative: str, src_stat) -> None:
+        dst_file = os.path.join(self.destination, relative)
+        os.makedirs(os.path.dirname(dst_file), exist_ok=True)
+        self._file = (relative, dst_file, src_stat)
+        self._fd = os.open(dst_file + PARTIAL_SUFFIX, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    def _write(self, chunk: _MirrorChunk) -> None:
+        view = memoryview(chunk.buffer)[:chunk.length]
+        written = 0
+        while written < chunk.length:
+            written += os.write(self._fd, view[written:])
+        self.progress.advance(chunk.length)
+
+    def _close(self, digest: Optional[str]) -> None:
+        relative, dst_file, src_stat = self._file
+        os.close(self._fd)
+        self._fd = None
+        os.replace(dst_file + PARTIAL_SUFFIX, dst_file)
+        os.utime(dst_file, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        if self.preserve_mode:
+            os.chmod(dst_file, stat.S_IMODE(src_stat.st_mode))
+        manifest = self.plan.manifest
+        if manifest is not None:
+            manifest['files'][relative] = _file_signature(src_stat)
+            if digest is not None:
+                manifest['files'][relative][HASH_ALGORITHM] = digest
+        self._copied.append((relative, src_stat))
+        self.files_copied += 1
+        self.total_size += src_stat.st_size
+        self.progress.file_done()
+
+    def _finish(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self.progress.finish()
+        sync_filesystem(self.destination)
+        failed = []
+        if self.verify and self._copied:
+            log.wait(f"Verifying {len(self._copied)} files on {self.destination}...")
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='copy-hash') as hash_pool:
+                failed = _verify_copies(self.plan._replace(pending=self._copied), self.buffer_size,
+                                        hash_pool)
+        if self.plan.manifest is not None:
+            save_manifest(self.destination, self.plan.manifest)
+            sync_filesystem(self.destination)
+        if failed:
+            self.files_copied -= len(failed)
+            raise VerificationError(failed)
+
+    def _handle(self, message: tuple) -> None:
+        kind = message[0]
+        if kind == 'open':
+            self._open(message[1], message[2])
+        elif kind == 'chunk':
+            self._write(message[1])
+        elif kind == 'close':
+            self._close(message[1])
+        elif kind == 'done':
+            self._finish()
+
+    def _run(self) -> None:
+        try:
+            os.makedirs(self.destination, exist_ok=True)
+            self.preserve_mode = filesystem_type(self.destination) in POSIX_FILESYSTEMS
+        except Exception as e:
+            self._fail(e)
+        while True:
+            message = self.queue.get()
             try:
-                shutil.copy2(src_file, dst_file)
-                log.info(f"Progress: {files_copied}/{total_files} files ({total_size/1024/1024:.1f} MB)")
+                if not self.failed:
+                    self._handle(message)
             except Exception as e:
-                log.error(f"Unable to copy {file}: {str(e)}")
-                raise
-    log.ok(f"Copy complete: {files_copied} files ({total_size/1024/1024:.1f} MB)")
-    return files_copied, total_size
+                self._fail(e)
+            finally:
+                if message[0] == 'chunk':
+                    message[1].release()
+            if message[0] == 'done':
+                return
+
+    def _fail(self, error: Exception) -> None:
+        self.error = error
+        name = self._file[0] if self._file else self.destination
+        log.error(f"Mirror to {self.destination} failed at {name}: {str(error)}")
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+def mirror_directory(plans: List[DirectoryPlan], buffer_size: int = DEFAULT_BUFFER_SIZE,
+                     on_progress: Optional[Callable] = None, verify: bool = False,
+                     pool_size: int = MIRROR_BUFFERS) -> dict:
+    source = plans[0].source
+    pending = sorted({relative for plan in plans for relative, _ in plan.pending})
+    log.info("=== MIRROR ANALYSIS ===")
+    log.debug(f"Source: {source} ({len(pending)} files to read)")
+    for plan in plans:
+        log.debug(f"Destination: {plan.destination} ({len(plan.pending)} files, "
+                  f"{plan_size(plan)/1024/1024:.1f} MB to copy)")
+        if plan.files_skipped:
+            log.info(f"Skipped {plan.files_skipped} files already on {plan.destination}")
+
+    pool = queue.Queue()
+    for _ in range(pool_size):
+        pool.put(bytearray(buffer_size))
+    hash_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='copy-hash') if verify else None
+    writers = [_MirrorWriter(plan, buffer_size, on_progress, verify) for plan in plans]
+    for writer in writers:
+        writer.start()
+
+    def broadcast(targets, *message):
+        for writer in targets:
+            writer.queue.put(message)
 
-def is_valid_usb(partition) -> bool:
-    if not partition.device.startswith('/dev/sd'):
-        return False
-    if not partition.mountpoint:
-        return False
-    if partition.fstype not in ['vfat', 'exfat', 'ntfs', 'ext4']:
-        return False
     try:
-        usage = shutil.disk_usage(partition.mountpoint)
-        total_size_gb = usage.total / (1024**3)
-        free_space_gb = usage.free / (1024**3)
-        if total_size_gb < 4:
-            log.debug(f"Device too small ({total_size_gb:.1f} GB)")
-            return False
-        log.debug(f"Device found: {total_size_gb:.1f} GB ({free_space_gb:.1f} GB free)")
-    except Exception as e:
-        log.debug(f"Could not check drive size: {str(e)}")
-        return False
-    return True
+        for relative in pending:
+            if all(writer.failed for writer in writers):
+                break
+            targets = [writer for writer in writers if relative in writer.wanted and not writer.failed]
+            if not targets:
+                continue
+            hasher = ChunkHasher(hash_pool) if hash_pool is not None else None
+            src_fd = os.open(os.path.join(source, relative), os.O_RDONLY)
+            try:
+                src_stat = os.fstat(src_fd)
+                broadcast(targets, 'open', relative, src_stat)
+                while True:
+                    buffer = pool.get()
+                    read = os.readv(src_fd, [buffer])
+                    if not read:
+                        pool.put(buffer)
+                        break
+                    live = [writer for writer in targets if not writer.failed]
+                    if not live:
+                        pool.put(buffer)
+                        break
+                    chunk = _MirrorChunk(buffer, read, len(live) + (hasher is not None), pool)
+                    if hasher is not None:
+                        hasher.submit(memoryview(buffer)[:read], chunk.release)
+                    for writer in live:
+                        writer.queue.put(('chunk', chunk))
+            finally:
+                os.close(src_fd)
+            broadcast(targets, 'close', hasher.hexdigest() if hasher is not None else None)
+    finally:
+        log.wait("Flushing data to destinations...")
+        broadcast(writers, 'done')
+        for writer in writers:
+            writer.join()
+        if hash_pool is not None:
+            hash_pool.shutdown()
+
+    results = {}
+    for writer in writers:
+        results[writer.destination] = MirrorResult(writer.files_copied, writer.total_size, writer.error)
+        if writer.error is None:
+            log.ok(f"Mirror complete: {writer.destination} "
+                   f"({writer.files_copied} files, {writer.total_size/1024/1024:.1f} MB)")
+    return results